@@ -6,11 +6,14 @@ Real-time Audio Transcription with faster-whisper
 
 import asyncio
 import logging
+import queue
 import time
 import threading
+import multiprocessing
+from multiprocessing import shared_memory
+from pathlib import Path
 from typing import Optional, Callable, List, Dict, Any
 from dataclasses import dataclass
-from queue import Queue, Empty
 import numpy as np
 
 # Audio processing
@@ -18,9 +21,41 @@ import pyaudio
 import soundfile as sf
 from scipy import signal
 
-# Whisper and AI
-from faster_whisper import WhisperModel
-import torch
+# Whisper and AI (torch is imported lazily, only for CUDA probing)
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+# Model conversion (pre-quantized model cache)
+try:
+    from ctranslate2.converters import TransformersConverter
+    HAS_CT2_CONVERTER = True
+except ImportError:
+    HAS_CT2_CONVERTER = False
+
+# Hugging Face source models for the sizes faster-whisper knows (same
+# resolution as faster_whisper.utils._MODELS, e.g. "large" is large-v3)
+WHISPER_HF_MODELS = {
+    "tiny.en": "openai/whisper-tiny.en",
+    "tiny": "openai/whisper-tiny",
+    "base.en": "openai/whisper-base.en",
+    "base": "openai/whisper-base",
+    "small.en": "openai/whisper-small.en",
+    "small": "openai/whisper-small",
+    "medium.en": "openai/whisper-medium.en",
+    "medium": "openai/whisper-medium",
+    "large-v1": "openai/whisper-large",
+    "large-v2": "openai/whisper-large-v2",
+    "large-v3": "openai/whisper-large-v3",
+    "large": "openai/whisper-large-v3",
+    "large-v3-turbo": "openai/whisper-large-v3-turbo",
+    "turbo": "openai/whisper-large-v3-turbo",
+    "distil-large-v2": "distil-whisper/distil-large-v2",
+    "distil-medium.en": "distil-whisper/distil-medium.en",
+    "distil-small.en": "distil-whisper/distil-small.en",
+    "distil-large-v3": "distil-whisper/distil-large-v3",
+}
+
+# Model sizes whose quantized conversion failed in this process (not retried)
+_QUANTIZE_FAILED: set = set()
 
 # VAD (Voice Activity Detection)
 try:
@@ -30,7 +65,59 @@ except ImportError:
     HAS_WEBRTC_VAD = False
     logging.warning("webrtcvad not available, using energy-based VAD")
 
-@dataclass
+# JIT compilation for the capture high-pass filter and the energy-based VAD fallback
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _mean_square(audio_data):
+        """Mean squared amplitude of samples in a single pass"""
+        total = 0.0
+        for i in range(audio_data.shape[0]):
+            value = float(audio_data[i])
+            total += value * value
+        return total / audio_data.shape[0]
+    
+    @njit(cache=True)
+    def _sosfilt_inplace(sos, audio_data, zi):
+        """scipy.signal.sosfilt (transposed direct form II) in place, updating zi"""
+        for i in range(audio_data.shape[0]):
+            x = float(audio_data[i])
+            for s in range(sos.shape[0]):
+                y = sos[s, 0] * x + zi[s, 0]
+                zi[s, 0] = sos[s, 1] * x - sos[s, 4] * y + zi[s, 1]
+                zi[s, 1] = sos[s, 2] * x - sos[s, 5] * y
+                x = y
+            audio_data[i] = x
+
+# Cached CUDA probe results (filled on first use)
+_CUDA_AVAILABLE: Optional[bool] = None
+_CUDA_CAPABILITY: Optional[tuple] = None
+
+def _cuda_available() -> bool:
+    """Check CUDA availability once per process"""
+    global _CUDA_AVAILABLE
+    if _CUDA_AVAILABLE is None:
+        try:
+            import torch
+            _CUDA_AVAILABLE = torch.cuda.is_available()
+        except ImportError:
+            _CUDA_AVAILABLE = False
+    return _CUDA_AVAILABLE
+
+def _cuda_capability() -> tuple:
+    """Get CUDA compute capability of the current device once per process"""
+    global _CUDA_CAPABILITY
+    if _CUDA_CAPABILITY is None:
+        import torch
+        _CUDA_CAPABILITY = torch.cuda.get_device_capability()
+    return _CUDA_CAPABILITY
+
+@dataclass(slots=True)
 class TranscriptionResult:
     """Speech recognition result data class"""
     text: str
@@ -46,18 +133,44 @@ class AudioProcessor:
     def __init__(self, 
                  sample_rate: int = 16000,
                  chunk_size: int = 1024,
-                 vad_mode: int = 3):
+                 vad_mode: int = 3,
+                 highpass_cutoff: Optional[float] = 80.0,
+                 ring_slots: int = 64):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.vad_mode = vad_mode
+        self.highpass_cutoff = highpass_cutoff
+        
+        # High-pass filter (removes DC offset and low-frequency rumble before VAD)
+        self._hp_sos = None
+        self._hp_zi = None
+        if highpass_cutoff:
+            self._hp_sos = signal.butter(4, highpass_cutoff, 'hp', fs=sample_rate, output='sos')
+            self._hp_zi = np.zeros((self._hp_sos.shape[0], 2))
+            if HAS_NUMBA:
+                # Compile now rather than in the first audio callback
+                _sosfilt_inplace(self._hp_sos, np.zeros(1, dtype=np.float32), np.zeros_like(self._hp_zi))
         
         # VAD setup
         self.vad = None
         if HAS_WEBRTC_VAD:
             self.vad = webrtcvad.Vad(vad_mode)
         
-        # Audio buffer
-        self.audio_buffer = Queue()
+        # Reusable scratch buffers for WebRTC VAD input, split into 30 ms frames
+        self._f32_scratch = np.empty(chunk_size, dtype=np.float32)
+        self._i16_scratch = np.empty(chunk_size, dtype=np.int16)
+        self._vad_frame_samples = sample_rate * 30 // 1000
+        self.webrtc_vad_used = False
+        
+        # Audio buffer: bounded single-producer/single-consumer ring of float32 chunks.
+        # The PyAudio callback only advances _head, the worker only advances _tail;
+        # when the worker falls behind, the oldest chunks are dropped.
+        self.ring_slots = ring_slots
+        self._audio_ring = np.empty((ring_slots, chunk_size), dtype=np.float32)
+        self._ring_lengths = np.zeros(ring_slots, dtype=np.int64)
+        self._head = 0
+        self._tail = 0
+        self._data_ready = threading.Event()
         self.is_recording = False
         
         # PyAudio setup
@@ -71,14 +184,33 @@ class AudioProcessor:
         if status:
             logging.warning(f"Audio callback status: {status}")
         
-        # Add audio data to buffer
-        audio_data = np.frombuffer(in_data, dtype=np.int16)
-        self.audio_buffer.put(audio_data)
+        # Scale to [-1, 1] float32 directly into the ring slot
+        audio_data = np.frombuffer(in_data, dtype=np.int16)[:self.chunk_size]
+        slot = self._head % self.ring_slots
+        n = len(audio_data)
+        samples = self._audio_ring[slot, :n]
+        np.multiply(audio_data, np.float32(1.0 / 32768.0), out=samples, casting='unsafe')
+        
+        # High-pass filter the slot in place (the filter is linear, so filtering
+        # after scaling is equivalent)
+        if self._hp_sos is not None:
+            if HAS_NUMBA:
+                _sosfilt_inplace(self._hp_sos, samples, self._hp_zi)
+            else:
+                samples[:], self._hp_zi = signal.sosfilt(self._hp_sos, samples, zi=self._hp_zi)
+        
+        self._ring_lengths[slot] = n
+        self._head += 1
+        self._data_ready.set()
         
         return (None, pyaudio.paContinue)
     
     def start_recording(self, device_index: Optional[int] = None):
         """Start audio recording"""
+        if self._hp_zi is not None:
+            self._hp_zi.fill(0.0)
+        self._tail = self._head
+        
         try:
             self.stream = self.pyaudio.open(
                 format=pyaudio.paInt16,
@@ -110,24 +242,57 @@ class AudioProcessor:
         logging.info("Audio recording stopped")
     
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
-        """Get audio chunk"""
-        try:
-            return self.audio_buffer.get(timeout=timeout)
-        except Empty:
-            return None
+        """Get audio chunk (view into the ring, valid until the producer laps it)"""
+        if self._head == self._tail:
+            self._data_ready.clear()
+            if self._head == self._tail and not self._data_ready.wait(timeout):
+                return None
+        
+        # Drop chunks the producer has overwritten (keep one slot of slack)
+        head = self._head
+        if head - self._tail >= self.ring_slots:
+            dropped = head - self._tail - self.ring_slots + 1
+            logging.warning(f"Audio ring overrun, dropped {dropped} chunks")
+            self._tail += dropped
+        
+        slot = self._tail % self.ring_slots
+        chunk = self._audio_ring[slot, :self._ring_lengths[slot]]
+        self._tail += 1
+        return chunk
     
     def is_speech(self, audio_data: np.ndarray) -> bool:
-        """Voice activity detection"""
-        if self.vad and len(audio_data) >= 320:  # WebRTC VAD requires at least 320 samples
-            # Convert to bytes for WebRTC VAD
-            audio_bytes = audio_data.astype(np.int16).tobytes()
+        """Voice activity detection on float32 samples in [-1, 1]
+        
+        Sets webrtc_vad_used to whether WebRTC VAD made the decision (False
+        when the energy fallback was used).
+        """
+        self.webrtc_vad_used = False
+        frame = self._vad_frame_samples
+        if self.vad and len(audio_data) >= frame:
+            # Convert back to int16 PCM for WebRTC VAD
+            # (clamped: filtered samples may exceed [-1, 1), and 1.0 * 32768 would wrap)
+            n = len(audio_data) - len(audio_data) % frame
+            scaled = self._f32_scratch[:n]
+            np.multiply(audio_data[:n], np.float32(32768.0), out=scaled)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            pcm = self._i16_scratch[:n]
+            pcm[:] = scaled
             try:
-                return self.vad.is_speech(audio_bytes, self.sample_rate)
+                # WebRTC VAD only accepts 10/20/30 ms frames: speech if any 30 ms frame is speech
+                speech = any(
+                    self.vad.is_speech(pcm[i:i + frame].tobytes(), self.sample_rate)
+                    for i in range(0, n, frame)
+                )
+                self.webrtc_vad_used = True
+                return speech
             except Exception as e:
                 logging.warning(f"WebRTC VAD error: {e}, falling back to energy-based VAD")
         
-        # Energy-based VAD fallback
-        energy = np.sum(audio_data.astype(np.float32) ** 2) / len(audio_data)
+        # Energy-based VAD fallback (in int16 amplitude units)
+        if HAS_NUMBA:
+            energy = _mean_square(audio_data) * (32768.0 ** 2)
+        else:
+            energy = float(np.dot(audio_data, audio_data)) * (32768.0 ** 2) / len(audio_data)
         threshold = 1000  # Adjust based on your environment
         return energy > threshold
     
@@ -137,6 +302,135 @@ class AudioProcessor:
         if hasattr(self, 'pyaudio'):
             self.pyaudio.terminate()
 
+def _inference_process_main(shm_name: str, buffer_size: int, model_path: str,
+                            device: str, compute_type: str, batch_size: int,
+                            requests, results):
+    """Child process entry point: load the model once and serve transcription requests"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    audio = np.ndarray((buffer_size,), dtype=np.float32, buffer=shm.buf)
+    
+    try:
+        model = WhisperModel(model_path, device=device, compute_type=compute_type)
+        if batch_size > 1:
+            model = BatchedInferencePipeline(model=model)
+        results.put(("ready", None))
+    except Exception as e:
+        results.put(("error", str(e)))
+        del audio
+        shm.close()
+        return
+    
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        
+        length, options = request
+        try:
+            segments, info = model.transcribe(audio[:length], **options)
+            items = [
+                (segment.text.strip(), segment.start, segment.end, getattr(segment, 'avg_logprob', 0.0))
+                for segment in segments
+                if segment.text.strip()
+            ]
+            results.put(("ok", (items, info.language)))
+        except Exception as e:
+            results.put(("error", str(e)))
+    
+    del audio
+    shm.close()
+
+class InferenceProcess:
+    """Whisper model hosted in a child process, fed through shared memory"""
+    
+    def __init__(self, buffer_size: int, model_path: str, device: str, compute_type: str,
+                 batch_size: int = 0):
+        self.buffer_size = buffer_size
+        self.model_path = model_path
+        self.device = device
+        self.compute_type = compute_type
+        self.batch_size = batch_size
+        
+        self.shm = None
+        self.audio = None
+        self.process = None
+        self.requests = None
+        self.results = None
+    
+    def start(self):
+        """Start the child process and wait until the model is loaded"""
+        # spawn: CUDA cannot be used in forked children
+        ctx = multiprocessing.get_context("spawn")
+        self.shm = shared_memory.SharedMemory(create=True, size=self.buffer_size * 4)
+        self.audio = np.ndarray((self.buffer_size,), dtype=np.float32, buffer=self.shm.buf)
+        self.requests = ctx.Queue()
+        self.results = ctx.Queue()
+        
+        self.process = ctx.Process(
+            target=_inference_process_main,
+            args=(self.shm.name, self.buffer_size, self.model_path, self.device,
+                  self.compute_type, self.batch_size, self.requests, self.results),
+            daemon=True
+        )
+        self.process.start()
+        
+        try:
+            status, payload = self._get_result()
+        except RuntimeError as e:
+            status, payload = "error", str(e)
+        if status != "ready":
+            self.close()
+            raise RuntimeError(f"Inference process failed to load model: {payload}")
+        
+        logging.info(f"Inference process started: pid={self.process.pid}")
+    
+    def transcribe(self, audio: np.ndarray, **options) -> tuple:
+        """Transcribe audio in the child process"""
+        length = len(audio)
+        if not np.may_share_memory(audio, self.audio):
+            self.audio[:length] = audio
+        self.requests.put((length, options))
+        
+        status, payload = self._get_result()
+        if status != "ok":
+            raise RuntimeError(payload)
+        return payload
+    
+    def _get_result(self, poll_interval: float = 0.5) -> tuple:
+        """Wait for the next result, failing if the child process has exited"""
+        while True:
+            try:
+                return self.results.get(timeout=poll_interval)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    break
+        
+        # The child may have posted a result just before exiting
+        try:
+            return self.results.get_nowait()
+        except queue.Empty:
+            raise RuntimeError(
+                f"Inference process exited unexpectedly (exitcode={self.process.exitcode})"
+            ) from None
+    
+    def close(self):
+        """Stop the child process and release shared memory"""
+        if self.process is not None:
+            if self.process.is_alive():
+                self.requests.put(None)
+                self.process.join(timeout=5.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        
+        if self.shm is not None:
+            self.audio = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        
+        logging.info("Inference process stopped")
+
 class RealtimeTranscriber:
     """Real-time speech recognition main class"""
     
@@ -146,7 +440,10 @@ class RealtimeTranscriber:
                  compute_type: str = "auto",
                  language: Optional[str] = None,
                  sample_rate: int = 16000,
-                 buffer_duration: float = 5.0):
+                 buffer_duration: float = 5.0,
+                 model_cache_dir: Optional[str] = None,
+                 use_subprocess: bool = False,
+                 batch_size: int = 0):
         
         self.model_size = model_size
         self.device = self._detect_device() if device == "auto" else device
@@ -155,11 +452,26 @@ class RealtimeTranscriber:
         self.sample_rate = sample_rate
         self.buffer_duration = buffer_duration
         self.buffer_size = int(sample_rate * buffer_duration)
+        self.model_cache_dir = Path(model_cache_dir or "~/.cache/realtime-whisper").expanduser()
+        self.use_subprocess = use_subprocess
+        self.batch_size = batch_size  # > 1 enables batched decoding of VAD chunks
         
         # Initialize components
         self.audio_processor = AudioProcessor(sample_rate=sample_rate)
         self.model = None
-        self.audio_buffer = np.array([], dtype=np.float32)
+        self.inference_process: Optional[InferenceProcess] = None
+        
+        # Preallocated ring buffer holding the most recent buffer_duration seconds
+        self._ring = np.empty(self.buffer_size, dtype=np.float32)
+        self._snapshot = np.empty(self.buffer_size, dtype=np.float32)
+        self._write = 0
+        self._filled = 0
+        
+        # Speech gating on the audio clock (seconds of audio received)
+        self._samples_seen = 0
+        self._last_speech_t = 0.0
+        self._last_transcribed_t = 0.0
+        self.min_new_speech = 0.5
         
         # Transcription callback
         self.transcription_callback: Optional[Callable[[TranscriptionResult], None]] = None
@@ -172,7 +484,7 @@ class RealtimeTranscriber:
     
     def _detect_device(self) -> str:
         """Detect available device"""
-        if torch.cuda.is_available():
+        if _cuda_available():
             return "cuda"
         else:
             return "cpu"
@@ -182,30 +494,148 @@ class RealtimeTranscriber:
         if self.device == "cuda":
             # Decide based on CUDA compute capability
             try:
-                capability = torch.cuda.get_device_capability()
-                if capability[0] >= 8:  # RTX 30xx series and newer
-                    return "float16"
+                capability = _cuda_capability()
+                if capability[0] >= 7:  # Volta/Turing and newer: int8 weights, fp16 activations
+                    return "int8_float16"
                 else:
                     return "int8"
             except:
-                return "float16"
+                # Let CTranslate2 pick the fastest supported type
+                return "auto"
         else:
             return "int8"
     
+    def _ensure_quantized_model(self) -> str:
+        """Get path of a pre-quantized model, converting it once if missing"""
+        # Local model directories, runtime type selection and sizes without a
+        # known source model are used as-is
+        hf_model = WHISPER_HF_MODELS.get(self.model_size)
+        if Path(self.model_size).is_dir() or self.compute_type == "auto" or hf_model is None:
+            return self.model_size
+        
+        output_dir = self.model_cache_dir / f"{self.model_size}-{self.compute_type}"
+        if (output_dir / "model.bin").exists():
+            return str(output_dir)
+        
+        if not HAS_CT2_CONVERTER:
+            logging.warning("ctranslate2 converter not available, quantizing at load time")
+            return self.model_size
+        
+        if (self.model_size, self.compute_type) in _QUANTIZE_FAILED:
+            return self.model_size
+        
+        try:
+            logging.info(f"Quantizing Whisper model to {self.compute_type}: {output_dir}")
+            output_dir.parent.mkdir(parents=True, exist_ok=True)
+            converter = TransformersConverter(
+                hf_model,
+                copy_files=["tokenizer.json", "preprocessor_config.json"]
+            )
+            converter.convert(str(output_dir), quantization=self.compute_type, force=True)
+            return str(output_dir)
+        except Exception as e:
+            logging.warning(f"Model quantization failed: {e}, quantizing at load time")
+            _QUANTIZE_FAILED.add((self.model_size, self.compute_type))
+            return self.model_size
+    
     def load_model(self):
         """Load Whisper model"""
         try:
             logging.info(f"Loading Whisper model: {self.model_size}")
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
-            )
+            if self.use_subprocess:
+                self.inference_process = InferenceProcess(
+                    self.buffer_size,
+                    self._ensure_quantized_model(),
+                    self.device,
+                    self.compute_type,
+                    self.batch_size
+                )
+                self.inference_process.start()
+            else:
+                self.model = WhisperModel(
+                    self._ensure_quantized_model(),
+                    device=self.device,
+                    compute_type=self.compute_type
+                )
+                if self.batch_size > 1:
+                    self.model = BatchedInferencePipeline(model=self.model)
             logging.info("Whisper model loaded successfully")
         except Exception as e:
             logging.error(f"Failed to load Whisper model: {e}")
             raise
     
+    def _append_audio(self, samples: np.ndarray):
+        """Write samples into the ring buffer, overwriting the oldest data"""
+        n = len(samples)
+        if n >= self.buffer_size:
+            self._ring[:] = samples[-self.buffer_size:]
+            self._write = 0
+            self._filled = self.buffer_size
+            return
+        
+        end = self._write + n
+        if end <= self.buffer_size:
+            self._ring[self._write:end] = samples
+        else:
+            split = self.buffer_size - self._write
+            self._ring[self._write:] = samples[:split]
+            self._ring[:n - split] = samples[split:]
+        
+        self._write = end % self.buffer_size
+        self._filled = min(self._filled + n, self.buffer_size)
+    
+    def _get_audio_window(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get buffered audio in chronological order as a contiguous array
+        
+        Without out, returns a view into the ring when possible. With out, the
+        window is always materialized directly into that buffer.
+        """
+        start = self._write - self._filled
+        if start >= 0 and out is None:
+            return self._ring[start:self._write]
+        
+        if out is None:
+            out = self._snapshot
+        
+        # Copy the (possibly wrapped) halves straight into the destination
+        if start >= 0:
+            out[:self._filled] = self._ring[start:self._write]
+        else:
+            head = self._ring[start:]
+            out[:len(head)] = head
+            out[len(head):self._filled] = self._ring[:self._write]
+        return out[:self._filled]
+    
+    def _trim_audio(self, keep_samples: int):
+        """Keep only the newest keep_samples in the ring buffer"""
+        self._filled = min(self._filled, keep_samples)
+    
+    def _transcribe_window(self, audio: np.ndarray, **options) -> List[TranscriptionResult]:
+        """Run Whisper on an audio window (in-process or in the inference process)"""
+        if self.batch_size > 1:
+            options['batch_size'] = self.batch_size
+        
+        if self.inference_process is not None:
+            items, language = self.inference_process.transcribe(audio, **options)
+            return [
+                TranscriptionResult(text, start, end, confidence, language)
+                for text, start, end, confidence in items
+            ]
+        
+        segments, info = self.model.transcribe(audio, **options)
+        return [
+            TranscriptionResult(
+                text=segment.text.strip(),
+                start_time=segment.start,
+                end_time=segment.end,
+                confidence=getattr(segment, 'avg_logprob', 0.0),
+                language=info.language,
+                is_final=True
+            )
+            for segment in segments
+            if segment.text.strip()
+        ]
+    
     def set_transcription_callback(self, callback: Callable[[TranscriptionResult], None]):
         """Set callback function for transcription results"""
         self.transcription_callback = callback
@@ -223,48 +653,42 @@ class RealtimeTranscriber:
                     continue
                 
                 # Add to audio buffer
-                audio_float = audio_chunk.astype(np.float32) / 32768.0
-                self.audio_buffer = np.concatenate([self.audio_buffer, audio_float])
-                
-                # Limit buffer size
-                if len(self.audio_buffer) > self.buffer_size:
-                    self.audio_buffer = self.audio_buffer[-self.buffer_size:]
+                self._append_audio(audio_chunk)
+                self._samples_seen += len(audio_chunk)
                 
                 # Voice activity detection
                 if not self.audio_processor.is_speech(audio_chunk):
                     continue
+                self._last_speech_t = self._samples_seen / self.sample_rate
                 
                 # Check if we have enough audio data
-                if len(self.audio_buffer) < self.sample_rate * 1.0:  # At least 1 second
+                if self._filled < self.sample_rate * 1.0:  # At least 1 second
                     continue
                 
+                # Skip Whisper until enough new speech arrived since the last run
+                if self._last_speech_t - self._last_transcribed_t < self.min_new_speech:
+                    continue
+                self._last_transcribed_t = self._last_speech_t
+                
                 # Perform speech recognition
+                # (faster-whisper's own VAD is only skipped when WebRTC VAD gated this chunk)
                 start_time = time.time()
-                segments, info = self.model.transcribe(
-                    self.audio_buffer,
+                shared = self.inference_process.audio if self.inference_process else None
+                results = self._transcribe_window(
+                    self._get_audio_window(out=shared),
                     language=self.language,
                     task="transcribe",
-                    vad_filter=True,
+                    vad_filter=not self.audio_processor.webrtc_vad_used,
                     vad_parameters=dict(min_silence_duration_ms=500)
                 )
                 
                 # Process results
-                for segment in segments:
-                    if segment.text.strip():
-                        result = TranscriptionResult(
-                            text=segment.text.strip(),
-                            start_time=segment.start,
-                            end_time=segment.end,
-                            confidence=getattr(segment, 'avg_logprob', 0.0),
-                            language=info.language,
-                            is_final=True
-                        )
-                        
-                        if self.transcription_callback:
-                            self.transcription_callback(result)
+                for result in results:
+                    if self.transcription_callback:
+                        self.transcription_callback(result)
                 
                 # Clear old buffer to prevent memory buildup
-                self.audio_buffer = self.audio_buffer[-int(self.sample_rate * 2.0):]
+                self._trim_audio(int(self.sample_rate * 2.0))
                 
             except Exception as e:
                 logging.error(f"Transcription error: {e}")
@@ -278,9 +702,17 @@ class RealtimeTranscriber:
             logging.warning("Transcriber is already running")
             return
         
-        if self.model is None:
+        if self.model is None and self.inference_process is None:
             self.load_model()
         
+        # Start a fresh audio clock for each recording session
+        # (the transcriber may be reused across sessions)
+        self._write = 0
+        self._filled = 0
+        self._samples_seen = 0
+        self._last_speech_t = 0.0
+        self._last_transcribed_t = 0.0
+        
         try:
             # Start audio recording
             self.audio_processor.start_recording(device_index=device_index)
@@ -310,6 +742,14 @@ class RealtimeTranscriber:
         
         logging.info("Real-time transcription stopped")
     
+    def close(self):
+        """Stop transcription and shut down the inference process, if any"""
+        self.stop()
+        
+        if self.inference_process is not None:
+            self.inference_process.close()
+            self.inference_process = None
+    
     def get_available_devices(self) -> List[Dict[str, Any]]:
         """Get list of available audio devices"""
         devices = []
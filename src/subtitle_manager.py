@@ -8,30 +8,67 @@ Subtitle management and file export functionality
 import os
 import logging
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import threading
+import queue
+from collections import deque
+from itertools import islice
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Deque, Tuple
+from dataclasses import dataclass
 import json
 from pathlib import Path
+import numpy as np
 
-# Subtitle format libraries
+# Fast JSON serialization
 try:
-    import srt
-    HAS_SRT = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_SRT = False
-    logging.warning("srt library not available")
+    HAS_ORJSON = False
 
+# Streaming JSON parsing
 try:
-    import webvtt
-    HAS_WEBVTT = True
+    import ijson
+    HAS_IJSON = True
 except ImportError:
-    HAS_WEBVTT = False
-    logging.warning("webvtt library not available")
+    HAS_IJSON = False
+
+# Multi-pattern text search
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 from .realtime_transcriber import TranscriptionResult
 
-@dataclass
+class _LazyDatetime:
+    """Wraps a slot descriptor so ISO 8601 strings are parsed on first access
+    
+    The raw value stays in the slot until then, so restored segments can be
+    re-exported without ever parsing their timestamps.
+    """
+    
+    def __init__(self, slot):
+        self.slot = slot
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            self.slot.__set__(obj, value)
+        return value
+    
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+    
+    def raw(self, obj):
+        """Get the stored value without parsing it"""
+        return self.slot.__get__(obj, type(obj))
+
+@dataclass(slots=True, frozen=True)
 class SubtitleSegment:
     """Subtitle segment data class"""
     index: int
@@ -48,19 +85,38 @@ class SubtitleSegment:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format"""
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        return data
+        created_at = SubtitleSegment.created_at.raw(self)  # may still be the raw ISO string
+        return {
+            'index': self.index,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'text': self.text,
+            'confidence': self.confidence,
+            'language': self.language,
+            'created_at': created_at if isinstance(created_at, str) else created_at.isoformat(),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SubtitleSegment':
-        """Restore from dictionary"""
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        """Restore from dictionary (created_at is parsed lazily on first access)"""
         return cls(**data)
 
+# Parse created_at lazily (restored segments hold the raw ISO string)
+SubtitleSegment.created_at = _LazyDatetime(SubtitleSegment.created_at)
+
 class SubtitleManager:
     """Subtitle management class"""
     
+    # Column arrays mirroring self.segments for vectorized queries
+    # (_segment holds the SubtitleSegment objects for gathering by mask or index,
+    # _end_max holds the running maximum of end times for binary search,
+    # _text_lower holds lowercase text for substring search)
+    _COLUMNS = ('_segment', '_start', '_end', '_end_max', '_text_lower')
+    _INITIAL_CAPACITY = 256
+    
+    # User-space buffer for streamed exports
+    _WRITE_BUFFER_SIZE = 1 << 20
+    
     def __init__(self, 
                  output_dir: str = "outputs",
                  auto_save_interval: float = 30.0,
@@ -73,15 +129,27 @@ class SubtitleManager:
         self.max_segments = max_segments
         
         # Subtitle segment management
-        self.segments: List[SubtitleSegment] = []
+        self.segments: Deque[SubtitleSegment] = deque(maxlen=max_segments)
         self.segment_counter = 0
+        self._reset_columns()
         
         # Session management
         self.session_start_time = datetime.now()
         self.session_id = self.session_start_time.strftime("%Y%m%d_%H%M%S")
         
-        # Auto-save timer
+        # Auto-save timer and segments not yet appended to the autosave log
         self.last_save_time = time.time()
+        self._unsaved_segments: List[SubtitleSegment] = []
+        
+        # Background auto-save thread (keeps serialization off the transcription thread).
+        # The single-slot queue coalesces requests: a save already pending covers
+        # every segment added before it runs.
+        self._lock = threading.Lock()
+        self._save_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._autosave_thread = None
+        if auto_save_interval > 0:
+            self._autosave_thread = threading.Thread(target=self._autosave_loop, daemon=True)
+            self._autosave_thread.start()
         
         logging.info(f"SubtitleManager initialized: session_id={self.session_id}")
     
@@ -99,124 +167,227 @@ class SubtitleManager:
             created_at=datetime.now()
         )
         
-        self.segments.append(segment)
+        with self._lock:
+            self._append_segment(segment)
+            self._unsaved_segments.append(segment)
         
-        # Remove old segments if exceeding max
-        if len(self.segments) > self.max_segments:
-            self.segments = self.segments[-self.max_segments:]
-        
-        # Check for auto-save
-        current_time = time.time()
-        if current_time - self.last_save_time >= self.auto_save_interval:
+        if self._autosave_thread is None:
+            # auto_save_interval <= 0: save every segment inline as it is added
             self.auto_save()
-            self.last_save_time = current_time
+            self.last_save_time = time.time()
+        elif time.time() - self.last_save_time >= self.auto_save_interval:
+            self.last_save_time = time.time()
+            self._request_save()
         
-        logging.debug(f"Added subtitle segment: {segment.text[:50]}...")
+        logging.debug("Added subtitle segment: %.50s...", segment.text)
         return segment
     
     def get_recent_segments(self, count: int = 10) -> List[SubtitleSegment]:
-        """Get recent segments"""
-        return self.segments[-count:] if self.segments else []
+        """Get recent segments (same rows as segments[-count:], so 0 returns all)"""
+        with self._lock:
+            total = len(self.segments)
+            start = max(0, total - count) if count > 0 else min(total, -count)
+            return list(islice(self.segments, start, None))
     
     def get_segments_by_time_range(self, 
                                   start_time: float, 
                                   end_time: float) -> List[SubtitleSegment]:
         """Get segments by time range"""
-        return [
-            segment for segment in self.segments
-            if (segment.start_time >= start_time and segment.end_time <= end_time) or
-               (segment.start_time <= start_time and segment.end_time >= start_time) or
-               (segment.start_time <= end_time and segment.end_time >= end_time)
-        ]
+        # Read the sort flag with the rows it describes (see _snapshot)
+        with self._lock:
+            starts_sorted = self._starts_sorted
+            rows = slice(self._head, self._tail)
+            segments, starts, ends, end_max = (
+                self._segment[rows], self._start[rows], self._end[rows], self._end_max[rows]
+            )
+        
+        # Segments normally arrive in start_time order: binary search the candidate
+        # rows (start <= end_time, and no earlier row ending after start_time)
+        if starts_sorted:
+            lo = np.searchsorted(end_max, start_time, side='left')
+            hi = np.searchsorted(starts, end_time, side='right')
+            segments, starts, ends = segments[lo:hi], starts[lo:hi], ends[lo:hi]
+        
+        # Any overlap between [segment.start_time, segment.end_time] and the range
+        mask = (starts <= end_time) & (ends >= start_time)
+        return segments[mask].tolist()
     
     def search_segments(self, query: str) -> List[SubtitleSegment]:
         """Search segments by text"""
         query_lower = query.lower()
+        segments, texts_lower = self._snapshot('_segment', '_text_lower')
         return [
-            segment for segment in self.segments
-            if query_lower in segment.text.lower()
+            segments[i]
+            for i, text_lower in enumerate(texts_lower)
+            if query_lower in text_lower
         ]
     
+    def search_many(self, queries: List[str]) -> List[Tuple[SubtitleSegment, List[str]]]:
+        """Search segments for several queries in one pass
+        
+        Returns (segment, matched queries) pairs for segments matching at least one query.
+        """
+        # Queries differing only in case share a pattern
+        patterns: Dict[str, List[str]] = {}
+        for query in queries:
+            if query:
+                patterns.setdefault(query.lower(), []).append(query)
+        if not patterns:
+            return []
+        
+        segments, texts_lower = self._snapshot('_segment', '_text_lower')
+        results = []
+        
+        if HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+            for pattern, pattern_queries in patterns.items():
+                automaton.add_word(pattern, pattern_queries)
+            automaton.make_automaton()
+            
+            for segment, text_lower in zip(segments, texts_lower):
+                found = {query for _, pattern_queries in automaton.iter(text_lower) for query in pattern_queries}
+                if found:
+                    results.append((segment, [query for query in queries if query in found]))
+        else:
+            for segment, text_lower in zip(segments, texts_lower):
+                found = {
+                    query
+                    for pattern, pattern_queries in patterns.items() if pattern in text_lower
+                    for query in pattern_queries
+                }
+                if found:
+                    results.append((segment, [query for query in queries if query in found]))
+        
+        return results
+    
     def export_srt(self, filename: Optional[str] = None) -> str:
         """Export in SRT format"""
-        if not HAS_SRT:
-            raise ImportError("srt library is required for SRT export")
-        
         if filename is None:
             filename = f"subtitles_{self.session_id}.srt"
         
         filepath = self.output_dir / filename
         
-        # Generate SRT subtitles
-        srt_subtitles = []
-        for segment in self.segments:
-            subtitle = srt.Subtitle(
-                index=segment.index,
-                start=timedelta(seconds=segment.start_time),
-                end=timedelta(seconds=segment.end_time),
-                content=segment.text
-            )
-            srt_subtitles.append(subtitle)
+        # Generate SRT subtitles (HH:MM:SS,mmm timestamps, cues numbered from 1)
+        segments, start_times, end_times = self._snapshot('_segment', '_start', '_end')
+        starts = self._format_timestamps(start_times, decimal_sep=',')
+        ends = self._format_timestamps(end_times, decimal_sep=',')
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(srt.compose(srt_subtitles))
+        # Stream cues to file
+        with open(filepath, 'w', encoding='utf-8', newline='\n', buffering=self._WRITE_BUFFER_SIZE) as f:
+            f.writelines(
+                f"{number}\n{start} --> {end}\n{segment.text}\n\n"
+                for number, (segment, start, end) in enumerate(zip(segments, starts, ends), 1)
+            )
         
         logging.info(f"SRT exported: {filepath}")
         return str(filepath)
     
     def export_webvtt(self, filename: Optional[str] = None) -> str:
         """Export in WebVTT format"""
-        if not HAS_WEBVTT:
-            raise ImportError("webvtt library is required for WebVTT export")
-        
         if filename is None:
             filename = f"subtitles_{self.session_id}.vtt"
         
         filepath = self.output_dir / filename
         
-        # Generate WebVTT subtitles
-        vtt = webvtt.WebVTT()
-        
-        for segment in self.segments:
-            start_time = self._seconds_to_webvtt_time(segment.start_time)
-            end_time = self._seconds_to_webvtt_time(segment.end_time)
-            
-            caption = webvtt.Caption(
-                start_time,
-                end_time,
-                segment.text
+        # Generate WebVTT subtitles (HH:MM:SS.mmm timestamps)
+        segments, start_times, end_times = self._snapshot('_segment', '_start', '_end')
+        starts = self._format_timestamps(start_times)
+        ends = self._format_timestamps(end_times)
+        
+        # Stream cues to file
+        with open(filepath, 'w', encoding='utf-8', newline='\n', buffering=self._WRITE_BUFFER_SIZE) as f:
+            f.write("WEBVTT\n\n")
+            f.writelines(
+                f"{start} --> {end}\n{segment.text}\n\n"
+                for segment, start, end in zip(segments, starts, ends)
             )
-            vtt.captions.append(caption)
-        
-        # Write to file
-        vtt.save(str(filepath))
         
         logging.info(f"WebVTT exported: {filepath}")
         return str(filepath)
     
-    def export_json(self, filename: Optional[str] = None) -> str:
-        """Export in JSON format (with detailed info)"""
+    def export_json(self, filename: Optional[str] = None, pretty: bool = False) -> str:
+        """Export in JSON format (with detailed info)
+        
+        Compact by default; pretty=True writes the indent=2 layout.
+        """
         if filename is None:
             filename = f"subtitles_{self.session_id}.json"
         
         filepath = self.output_dir / filename
         
+        segments = self._snapshot('_segment')[0]
+        header, separator, footer = self._json_export_parts(len(segments), pretty)
+        
+        # Write to file, one segment at a time (segments are streamed after the header)
+        with open(filepath, 'wb', buffering=self._WRITE_BUFFER_SIZE) as f:
+            f.write(header)
+            for i, segment in enumerate(segments):
+                if i:
+                    f.write(separator)
+                f.write(self._json_export_segment(segment, pretty))
+            f.write(footer)
+        
+        logging.info(f"JSON exported: {filepath}")
+        return str(filepath)
+    
+    def _json_export_parts(self, count: int, pretty: bool) -> Tuple[bytes, bytes, bytes]:
+        """Header, separator and footer around the segments of a JSON export"""
         # JSON data structure
         data = {
             'session_id': self.session_id,
             'session_start_time': self.session_start_time.isoformat(),
             'export_time': datetime.now().isoformat(),
-            'total_segments': len(self.segments),
-            'segments': [segment.to_dict() for segment in self.segments]
+            'total_segments': count,
         }
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if pretty:
+            # Same layout as json.dump(indent=2)
+            header = self._dump_json(data, indent=True)[:-2] + b',\n  "segments": ['  # drop the closing "\n}"
+            return header, b',', b'\n  ]\n}' if count else b']\n}'
+        return self._dump_json(data)[:-1] + b',"segments":[', b',', b']}'  # drop the closing "}"
+    
+    def _json_export_segment(self, segment: SubtitleSegment, pretty: bool) -> bytes:
+        """Serialize one segment for a JSON export"""
+        if pretty:
+            return b'\n    ' + self._dump_json(segment, indent=True).replace(b'\n', b'\n    ')
+        return self._dump_json(segment)
+    
+    def export_all(self, basename: Optional[str] = None, pretty: bool = False) -> Tuple[str, str, str]:
+        """Export JSON, TXT and SRT in a single pass over the segments
+        
+        Returns the (json, txt, srt) file paths.
+        """
+        if basename is None:
+            basename = f"subtitles_{self.session_id}"
+        
+        json_path = self.output_dir / f"{basename}.json"
+        txt_path = self.output_dir / f"{basename}.txt"
+        srt_path = self.output_dir / f"{basename}.srt"
+        
+        # Timestamps are formatted once; SRT only swaps the decimal separator
+        segments, start_times, end_times = self._snapshot('_segment', '_start', '_end')
+        starts = self._format_timestamps(start_times)
+        ends = self._format_timestamps(end_times)
+        header, separator, footer = self._json_export_parts(len(segments), pretty)
+        
+        with open(json_path, 'wb', buffering=self._WRITE_BUFFER_SIZE) as json_f, \
+             open(txt_path, 'w', encoding='utf-8', buffering=self._WRITE_BUFFER_SIZE) as txt_f, \
+             open(srt_path, 'w', encoding='utf-8', newline='\n', buffering=self._WRITE_BUFFER_SIZE) as srt_f:
+            json_f.write(header)
+            txt_f.write(f"# Subtitles Session: {self.session_id}\n")
+            txt_f.write(f"# Created: {self.session_start_time}\n\n")
+            
+            for i, (segment, start, end) in enumerate(zip(segments, starts, ends)):
+                if i:
+                    json_f.write(separator)
+                json_f.write(self._json_export_segment(segment, pretty))
+                txt_f.write(f"[{start} - {end}] {segment.text}\n")
+                srt_f.write(f"{i + 1}\n{start.replace('.', ',')} --> {end.replace('.', ',')}\n{segment.text}\n\n")
+            
+            json_f.write(footer)
         
-        logging.info(f"JSON exported: {filepath}")
-        return str(filepath)
+        logging.info(f"JSON/TXT/SRT exported: {json_path.with_suffix('')}.*")
+        return str(json_path), str(txt_path), str(srt_path)
     
     def export_txt(self, filename: Optional[str] = None) -> str:
         """Export in plain text format"""
@@ -225,58 +396,139 @@ class SubtitleManager:
         
         filepath = self.output_dir / filename
         
+        segments, start_times, end_times = self._snapshot('_segment', '_start', '_end')
+        starts = self._format_timestamps(start_times)
+        ends = self._format_timestamps(end_times)
+        
         # Write text
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'w', encoding='utf-8', buffering=self._WRITE_BUFFER_SIZE) as f:
             f.write(f"# Subtitles Session: {self.session_id}\n")
             f.write(f"# Created: {self.session_start_time}\n\n")
-            
-            for segment in self.segments:
-                f.write(f"[{self._seconds_to_timestamp(segment.start_time)} - ")
-                f.write(f"{self._seconds_to_timestamp(segment.end_time)}] ")
-                f.write(f"{segment.text}\n")
+            f.writelines(
+                f"[{start} - {end}] {segment.text}\n"
+                for segment, start, end in zip(segments, starts, ends)
+            )
         
         logging.info(f"TXT exported: {filepath}")
         return str(filepath)
     
     def load_from_json(self, filepath: str) -> int:
-        """Load subtitle data from JSON file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Restore segments
-        loaded_segments = [
-            SubtitleSegment.from_dict(segment_data)
-            for segment_data in data['segments']
-        ]
-        
-        self.segments.extend(loaded_segments)
+        """Load subtitle data from JSON file (or a JSON Lines autosave log)"""
+        loaded_count = 0
+        max_index = 0
+        
+        with open(filepath, 'rb') as f:
+            if str(filepath).endswith('.jsonl'):
+                # Skip a torn final line left by an interrupted append
+                loads = orjson.loads if HAS_ORJSON else json.loads
+                segments_data = (
+                    loads(line) for line in f
+                    if line.endswith(b'\n') and line.strip()
+                )
+            elif HAS_IJSON:
+                # Stream-parse so only one segment is held in memory at a time
+                segments_data = ijson.items(f, 'segments.item', use_float=True)
+            elif HAS_ORJSON:
+                segments_data = orjson.loads(f.read())['segments']
+            else:
+                segments_data = json.load(f)['segments']
+            
+            # Restore segments
+            for segment_data in segments_data:
+                segment = SubtitleSegment.from_dict(segment_data)
+                with self._lock:
+                    self._append_segment(segment)
+                loaded_count += 1
+                max_index = max(max_index, segment.index)
         
         # Update counter
-        if loaded_segments:
-            max_index = max(segment.index for segment in loaded_segments)
-            self.segment_counter = max(self.segment_counter, max_index)
+        self.segment_counter = max(self.segment_counter, max_index)
         
-        logging.info(f"Loaded {len(loaded_segments)} segments from {filepath}")
-        return len(loaded_segments)
+        logging.info(f"Loaded {loaded_count} segments from {filepath}")
+        return loaded_count
     
     def auto_save(self):
-        """Auto-save (JSON format)"""
+        """Auto-save (JSON Lines format, appending only segments added since the last save)"""
+        with self._lock:
+            pending = self._unsaved_segments
+            self._unsaved_segments = []
+        if not pending:
+            return
+        
         try:
-            auto_save_file = f"autosave_{self.session_id}.json"
-            self.export_json(auto_save_file)
-            logging.debug(f"Auto-saved: {auto_save_file}")
+            lines = b"".join(self._dump_json(segment) + b"\n" for segment in pending)
+            
+            # No fsync: an interrupted append can only tear the last line,
+            # which load_from_json skips. The log is write-only during the
+            # session, so its pages are dropped from the page cache.
+            auto_save_file = self.output_dir / f"autosave_{self.session_id}.jsonl"
+            with open(auto_save_file, 'ab', buffering=self._WRITE_BUFFER_SIZE) as f:
+                f.write(lines)
+                f.flush()
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            
+            logging.debug(f"Auto-saved {len(pending)} segments: {auto_save_file}")
         except Exception as e:
+            # Keep the segments queued so the next save retries them
+            with self._lock:
+                self._unsaved_segments[:0] = pending
             logging.error(f"Auto-save failed: {e}")
     
+    def _request_save(self):
+        """Queue an auto-save unless one is already pending"""
+        try:
+            self._save_queue.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def _autosave_loop(self):
+        """Background auto-save loop (a None request stops the thread)"""
+        while True:
+            request = self._save_queue.get()
+            try:
+                if request is None:
+                    return
+                self.auto_save()
+            finally:
+                self._save_queue.task_done()
+    
+    def flush(self):
+        """Block until all added segments have been auto-saved"""
+        if self._autosave_thread is not None and self._autosave_thread.is_alive():
+            self._request_save()
+            self._save_queue.join()
+        else:
+            self.auto_save()
+    
+    def close(self):
+        """Flush pending segments and stop the auto-save thread"""
+        self.flush()
+        if self._autosave_thread is not None and self._autosave_thread.is_alive():
+            self._save_queue.put(None)
+            self._autosave_thread.join(timeout=5.0)
+    
     def clear_segments(self):
         """Clear all segments"""
-        self.segments.clear()
-        self.segment_counter = 0
+        with self._lock:
+            self.segments.clear()
+            self.segment_counter = 0
+            self._reset_columns()
         logging.info("All segments cleared")
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get statistics information"""
-        if not self.segments:
+        """Get statistics information (from running totals, O(1) in segment count)"""
+        with self._lock:
+            total_segments = len(self.segments)
+            total_duration = self._total_duration
+            total_confidence = self._total_confidence
+            # Fresh dicts in first-seen order (callers may modify the result)
+            languages = {
+                lang: {'count': count, 'duration': duration}
+                for lang, (count, duration) in self._language_stats.items()
+            }
+        
+        if not total_segments:
             return {
                 'total_segments': 0,
                 'total_duration': 0.0,
@@ -285,44 +537,150 @@ class SubtitleManager:
                 'session_duration': 0.0
             }
         
-        total_duration = sum(segment.duration() for segment in self.segments)
-        average_confidence = sum(segment.confidence for segment in self.segments) / len(self.segments)
-        
-        # Language statistics
-        languages = {}
-        for segment in self.segments:
-            lang = segment.language
-            if lang not in languages:
-                languages[lang] = {'count': 0, 'duration': 0.0}
-            languages[lang]['count'] += 1
-            languages[lang]['duration'] += segment.duration()
+        average_confidence = total_confidence / total_segments
         
         # Session duration
         session_duration = (datetime.now() - self.session_start_time).total_seconds()
         
         return {
-            'total_segments': len(self.segments),
+            'total_segments': total_segments,
             'total_duration': total_duration,
             'average_confidence': average_confidence,
             'languages': languages,
             'session_duration': session_duration,
             'session_start': self.session_start_time.isoformat(),
-            'segment_rate': len(self.segments) / session_duration if session_duration > 0 else 0
+            'segment_rate': total_segments / session_duration if session_duration > 0 else 0
         }
     
+    def _reset_columns(self):
+        """Allocate empty column arrays"""
+        self._head = 0
+        self._tail = 0
+        self._start = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._end = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._end_max = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._starts_sorted = True
+        self._segment = np.empty(self._INITIAL_CAPACITY, dtype=object)
+        self._text_lower = np.empty(self._INITIAL_CAPACITY, dtype=object)
+        
+        # Running totals for get_statistics (language -> [count, duration])
+        self._total_duration = 0.0
+        self._total_confidence = 0.0
+        self._language_stats: Dict[str, List] = {}
+    
+    def _append_segment(self, segment: SubtitleSegment):
+        """Append a segment, evicting the oldest one once max_segments is reached"""
+        if len(self.segments) == self.segments.maxlen:
+            self._update_statistics(self.segments[0], -1)
+            self._head += 1  # deque drops its leftmost item on append
+        self.segments.append(segment)
+        self._append_columns(segment)
+        self._update_statistics(segment, 1)
+    
+    def _update_statistics(self, segment: SubtitleSegment, sign: int):
+        """Add (sign=1) or remove (sign=-1) a segment's contribution to the running totals"""
+        duration = segment.duration()
+        self._total_duration += sign * duration
+        self._total_confidence += sign * segment.confidence
+        
+        stats = self._language_stats.setdefault(segment.language, [0, 0.0])
+        stats[0] += sign
+        stats[1] += sign * duration
+        if stats[0] == 0:
+            del self._language_stats[segment.language]
+    
+    def _append_columns(self, segment: SubtitleSegment):
+        """Append segment fields to the column arrays"""
+        if self._tail == len(self._start):
+            self._compact_columns()
+        
+        i = self._tail
+        if i > self._head:
+            self._end_max[i] = max(self._end_max[i - 1], segment.end_time)
+            if segment.start_time < self._start[i - 1]:
+                self._starts_sorted = False
+        else:
+            self._end_max[i] = segment.end_time
+        self._start[i] = segment.start_time
+        self._end[i] = segment.end_time
+        self._segment[i] = segment
+        self._text_lower[i] = segment.text.lower()
+        self._tail += 1
+    
+    def _compact_columns(self):
+        """Move live rows to the front, doubling capacity when more than half full"""
+        count = self._tail - self._head
+        capacity = len(self._start)
+        if count > capacity // 2:
+            capacity *= 2
+        
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:count] = old[self._head:self._tail]
+            setattr(self, name, new)
+        
+        self._head = 0
+        self._tail = count
+    
+    def _snapshot(self, *names: str) -> tuple:
+        """Get aligned views of the live rows of the named columns
+        
+        Live rows are never overwritten in place (compaction allocates new
+        arrays), so the views stay consistent after the lock is released.
+        """
+        with self._lock:
+            return tuple(getattr(self, name)[self._head:self._tail] for name in names)
+    
+    @staticmethod
+    def _dump_json(obj: Any, indent: bool = False) -> bytes:
+        """Serialize a dict or SubtitleSegment as UTF-8 JSON (compact unless indent=True)"""
+        # to_dict() keeps restored created_at strings unparsed
+        if isinstance(obj, SubtitleSegment):
+            obj = obj.to_dict()
+        if HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option)
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    @staticmethod
+    def _format_timestamps(seconds: np.ndarray, decimal_sep: str = '.') -> List[str]:
+        """Convert an array of seconds to HH:MM:SS.mmm strings in one pass"""
+        total_ms = np.rint(seconds * 1000.0).astype(np.int64)
+        hours, rem = np.divmod(total_ms, 3_600_000)
+        minutes, rem = np.divmod(rem, 60_000)
+        secs, millis = np.divmod(rem, 1000)
+        
+        fmt = "{:02d}:{:02d}:{:02d}" + decimal_sep + "{:03d}"
+        return [
+            fmt.format(h, m, s, ms)
+            for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+        ]
+    
+    @staticmethod
+    def _format_timestamp(seconds: float, decimal_sep: str = '.') -> str:
+        """Convert seconds to an HH:MM:SS.mmm string using integer milliseconds"""
+        ms = round(seconds * 1000)  # rounds half to even, like np.rint
+        hours, ms = divmod(ms, 3_600_000)
+        minutes, ms = divmod(ms, 60_000)
+        secs, ms = divmod(ms, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_sep}{ms:03d}"
+    
     def _seconds_to_timestamp(self, seconds: float) -> str:
         """Convert seconds to timestamp string"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        return self._format_timestamp(seconds)
+    
+    def _seconds_to_srt(self, seconds: float) -> str:
+        """Convert seconds to SRT time format (comma decimal separator)"""
+        return self._format_timestamp(seconds, ',')
     
     def _seconds_to_webvtt_time(self, seconds: float) -> str:
         """Convert seconds to WebVTT time format"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        return self._format_timestamp(seconds)
 
 if __name__ == "__main__":
     # Simple test execution
@@ -347,12 +705,8 @@ if __name__ == "__main__":
     print("Exporting subtitles...")
     print(f"JSON: {manager.export_json()}")
     print(f"TXT: {manager.export_txt()}")
-    
-    if HAS_SRT:
-        print(f"SRT: {manager.export_srt()}")
-    
-    if HAS_WEBVTT:
-        print(f"WebVTT: {manager.export_webvtt()}")
+    print(f"SRT: {manager.export_srt()}")
+    print(f"WebVTT: {manager.export_webvtt()}")
     
     # Statistics
     stats = manager.get_statistics()
@@ -10,10 +10,14 @@ generated subtitles back to speech, creating an AI voice output system.
 
 import logging
 import asyncio
-import threading
-from typing import Optional, Callable, List, Dict, Any, Union
+import functools
+import contextlib
+import os
+import math
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Optional, Callable, List, Dict, Any, Union, Tuple, AsyncIterator
 from dataclasses import dataclass
-from queue import Queue, Empty
 import numpy as np
 import io
 
@@ -33,6 +37,13 @@ except ImportError:
     HAS_COQUI_TTS = False
     logging.warning("Coqui TTS not available")
 
+# Pitch-preserving time-stretch
+try:
+    import librosa
+    HAS_LIBROSA = True
+except ImportError:
+    HAS_LIBROSA = False
+
 # Audio playback
 try:
     import sounddevice as sd
@@ -41,6 +52,21 @@ except ImportError:
     HAS_SOUNDDEVICE = False
     logging.warning("sounddevice not available for audio playback")
 
+# JIT compilation for the volume/clipping pass
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _gain_clip(wav, gain):
+        """Scale samples by gain and clip to [-1, 1] in place, in a single pass"""
+        for i in range(wav.shape[0]):
+            value = wav[i] * gain
+            wav[i] = -1.0 if value < -1.0 else (1.0 if value > 1.0 else value)
+
 from .realtime_transcriber import TranscriptionResult
 from .subtitle_manager import SubtitleSegment
 
@@ -55,6 +81,13 @@ class TTSConfig:
     language: str = "ja"
     sample_rate: int = 22050
     device: str = "auto"
+    half: bool = True  # reduced-precision inference on CUDA (ignored on CPU)
+    half_dtype: str = "float16"  # or "bfloat16"
+    voice_cache_capacity: int = 50  # conditioning latents kept per voice (XTTS-style models)
+    tune_threading: bool = True  # single-threaded torch intra-op pool on CPU (process-wide)
+    compile_model: bool = True  # torch.compile the model's inference on CUDA
+    offload_to_cpu: bool = False  # keep sub-models in host memory except while they run (CUDA)
+    warmup: bool = True  # synthesize dummy text after loading so the first request is fast
 
 @dataclass
 class TTSResult:
@@ -64,18 +97,52 @@ class TTSResult:
     sample_rate: int
     duration: float
     voice_id: str
+    is_streaming_chunk: bool = False  # part of an utterance from synthesize_stream
 
 class TTSEngine:
     """Text-to-Speech engine class"""
     
+    # STFT parameters for the phase-vocoder speed change
+    _STRETCH_N_FFT = 1024
+    _STRETCH_HOP = 256
+    
     def __init__(self, config: TTSConfig):
         self.config = config
         self.model = None
         self.is_loaded = False
         self.device = self._detect_device() if config.device == "auto" else config.device
         
+        # Reduced-precision dtype for CUDA inference (None runs in FP32)
+        self.half_dtype = None
+        if config.half and self.device == "cuda" and HAS_TORCH_AUDIO:
+            self.half_dtype = getattr(torch, config.half_dtype)
+        
+        # Conditioning latents per voice_id (LRU, only touched on the worker thread)
+        self._voice_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+        self._supports_latents = False
+        self._supports_streaming = False
+        
+        # Model calls run on one worker thread, off the event loop
+        # (TTS models are not thread-safe, so calls are serialized). On CPU the
+        # worker's first task limits torch to one intra-op thread so TTS does not
+        # contend with the transcriber's CTranslate2 threads. The setting is
+        # process-wide, but only TTS runs torch ops here; OMP_NUM_THREADS and
+        # MKL_NUM_THREADS are deployment settings and are left alone
+        initializer = None
+        if config.tune_threading and self.device == "cpu":
+            initializer = self._limit_torch_threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tts", initializer=initializer
+        )
+        
         logging.info(f"TTSEngine initialized with config: {config}")
     
+    @staticmethod
+    def _limit_torch_threads():
+        """Limit torch's intra-op thread pool (process-wide) to one thread"""
+        if HAS_TORCH_AUDIO:
+            torch.set_num_threads(1)
+    
     def _detect_device(self) -> str:
         """Detect available device"""
         if HAS_TORCH_AUDIO and torch.cuda.is_available():
@@ -92,12 +159,55 @@ class TTSEngine:
             logging.info(f"Loading TTS model: {self.config.model_name}")
             
             # Load Coqui TTS model
-            self.model = TTS(
-                model_name=self.config.model_name,
-                progress_bar=False,
-                gpu=(self.device == "cuda")
+            self.model = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                functools.partial(
+                    TTS,
+                    model_name=self.config.model_name,
+                    progress_bar=False,
+                    gpu=(self.device == "cuda")
+                )
             )
             
+            if self.half_dtype is not None:
+                self._convert_model_precision(self.half_dtype)
+            
+            # Models that expose conditioning latents (XTTS) let us skip the
+            # speaker encoder for voices that were already seen
+            tts_model = self._get_tts_model()
+            self._supports_latents = (
+                hasattr(tts_model, 'get_conditioning_latents') and hasattr(tts_model, 'inference')
+            )
+            self._supports_streaming = self._supports_latents and hasattr(tts_model, 'inference_stream')
+            self._voice_cache.clear()
+            
+            warmed_up = False
+            if self.device == "cuda" and HAS_TORCH_AUDIO:
+                # TF32 matmuls; no cuDNN autotuning since input lengths vary per text
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.benchmark = False
+                
+                if self.config.offload_to_cpu:
+                    # CUDA graphs need resident weights, so offloading replaces compilation
+                    self._enable_offload()
+                elif self.config.compile_model:
+                    warmed_up = await asyncio.get_running_loop().run_in_executor(self._executor, self._compile_model)
+            
+            if self.config.warmup and not warmed_up:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(self._executor, self._warmup)
+                except Exception as e:
+                    if self.half_dtype is None:
+                        logging.warning(f"TTS warmup failed: {e}")
+                    else:
+                        # Some models break in reduced precision; fall back to FP32
+                        logging.warning(f"TTS warmup failed in {self.config.half_dtype}, using float32: {e}")
+                        await asyncio.get_running_loop().run_in_executor(self._executor, self._disable_half)
+                        try:
+                            await asyncio.get_running_loop().run_in_executor(self._executor, self._warmup)
+                        except Exception as e:
+                            logging.warning(f"TTS warmup failed: {e}")
+            
             self.is_loaded = True
             logging.info("TTS model loaded successfully")
             
@@ -105,6 +215,141 @@ class TTSEngine:
             logging.error(f"Failed to load TTS model: {e}")
             raise
     
+    def _get_tts_model(self):
+        """Get the underlying acoustic model of the Coqui TTS wrapper"""
+        return getattr(getattr(self.model, 'synthesizer', None), 'tts_model', None)
+    
+    def _get_voice_latents(self, voice_id: str) -> Optional[Tuple[Any, Any]]:
+        """Get (gpt_cond_latent, speaker_embedding) for a voice, computing them once
+        
+        voice_id is either a reference audio file or a built-in speaker name.
+        """
+        latents = self._voice_cache.get(voice_id)
+        if latents is not None:
+            self._voice_cache.move_to_end(voice_id)
+            return latents
+        
+        tts_model = self._get_tts_model()
+        speakers = getattr(getattr(tts_model, 'speaker_manager', None), 'speakers', None) or {}
+        
+        if os.path.isfile(voice_id):
+            latents = tts_model.get_conditioning_latents(audio_path=[voice_id])
+        elif voice_id in speakers and 'gpt_cond_latent' in speakers[voice_id]:
+            latents = (speakers[voice_id]['gpt_cond_latent'], speakers[voice_id]['speaker_embedding'])
+        else:
+            return None
+        
+        self._voice_cache[voice_id] = latents
+        if len(self._voice_cache) > self.config.voice_cache_capacity:
+            self._voice_cache.popitem(last=False)
+        return latents
+    
+    def _convert_model_precision(self, dtype):
+        """Cast the acoustic model and vocoder weights to dtype"""
+        synthesizer = getattr(self.model, 'synthesizer', None)
+        for name in ('tts_model', 'vocoder_model'):
+            module = getattr(synthesizer, name, None)
+            if module is None:
+                continue
+            try:
+                module.to(dtype=dtype)
+            except Exception as e:
+                logging.warning(f"Could not convert TTS {name} to {dtype}: {e}")
+        
+        logging.info(f"TTS model running in {dtype}")
+    
+    def _disable_half(self):
+        """Return the model to FP32 and drop latents computed in half precision"""
+        self.half_dtype = None
+        self._convert_model_precision(torch.float32)
+        self._voice_cache.clear()
+    
+    def _enable_offload(self):
+        """Move the acoustic model and vocoder to the GPU only while each one runs
+        
+        Frees their VRAM for the transcriber between calls, at the cost of a
+        host-to-device copy of the weights per call.
+        """
+        synthesizer = getattr(self.model, 'synthesizer', None)
+        for name in ('tts_model', 'vocoder_model'):
+            module = getattr(synthesizer, name, None)
+            if module is None or not hasattr(module, 'inference'):
+                continue
+            module.to("cpu")
+            module.inference = self._offloaded(module, module.inference)
+            
+            # XTTS calls these directly, bypassing inference()
+            if hasattr(module, 'get_conditioning_latents'):
+                module.get_conditioning_latents = self._offloaded(module, module.get_conditioning_latents)
+            if hasattr(module, 'inference_stream'):
+                module.inference_stream = self._offloaded_stream(module, module.inference_stream)
+        
+        torch.cuda.empty_cache()
+        logging.info("TTS sub-models offloaded to CPU between calls")
+    
+    @staticmethod
+    def _offloaded(module, inference: Callable) -> Callable:
+        """Wrap a sub-model's inference() to load it onto the GPU for the call"""
+        @functools.wraps(inference)
+        def run(*args, **kwargs):
+            module.to("cuda", non_blocking=True)
+            try:
+                return inference(*args, **kwargs)
+            finally:
+                module.to("cpu")
+                torch.cuda.empty_cache()
+        return run
+    
+    @staticmethod
+    def _offloaded_stream(module, inference_stream: Callable) -> Callable:
+        """Wrap a sub-model's inference_stream() to keep it on the GPU until the stream ends"""
+        @functools.wraps(inference_stream)
+        def run(*args, **kwargs):
+            module.to("cuda", non_blocking=True)
+            try:
+                yield from inference_stream(*args, **kwargs)
+            finally:
+                module.to("cpu")
+                torch.cuda.empty_cache()
+        return run
+    
+    def _warmup(self):
+        """Run two dummy syntheses so kernel loading, CUDA context setup and
+        compilation happen at load time instead of on the first request"""
+        voice_id = self.config.voice_id
+        for _ in range(2):
+            self._synthesize_blocking(["warmup"], voice_id if voice_id != "default" else None)
+    
+    def _compile_model(self) -> bool:
+        """Compile the acoustic model and vocoder inference with CUDA graphs, then warm up
+        
+        Coqui calls the sub-models' inference() methods rather than forward(), so
+        those are compiled. Falls back to eager mode if compilation fails.
+        Returns True if the compiled model was warmed up.
+        """
+        synthesizer = getattr(self.model, 'synthesizer', None)
+        compiled = []
+        for name in ('tts_model', 'vocoder_model'):
+            module = getattr(synthesizer, name, None)
+            if module is None or not hasattr(module, 'inference'):
+                continue
+            module.inference = torch.compile(module.inference, mode="reduce-overhead")
+            compiled.append(module)
+        
+        if not compiled:
+            return False
+        
+        # Warmup runs compilation and CUDA graph capture
+        try:
+            self._warmup()
+            logging.info("TTS model compiled")
+            return True
+        except Exception as e:
+            logging.warning(f"TTS model compilation failed, using eager mode: {e}")
+            for module in compiled:
+                del module.inference
+            return False
+    
     async def synthesize(self, text: str, voice_id: Optional[str] = None) -> TTSResult:
         """Synthesize speech from text"""
         if not self.is_loaded:
@@ -113,55 +358,200 @@ class TTSEngine:
         if not text.strip():
             raise ValueError("Text cannot be empty")
         
+        return (await self.synthesize_batch([text], voice_id))[0]
+    
+    async def synthesize_batch(self, texts: List[str], voice_id: Optional[str] = None) -> List[TTSResult]:
+        """Synthesize several texts in one worker job (results keep the input order)"""
+        if not self.is_loaded:
+            await self.load_model()
+        
         try:
             # Perform speech synthesis
             voice_id = voice_id or self.config.voice_id
             
-            # Synthesize with Coqui TTS
-            wav = self.model.tts(
-                text=text,
-                speaker=voice_id if voice_id != "default" else None
+            # Synthesize on the worker thread
+            wavs = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._synthesize_blocking,
+                texts,
+                voice_id if voice_id != "default" else None
             )
             
-            # Convert to NumPy array
-            if isinstance(wav, list):
-                wav = np.array(wav, dtype=np.float32)
+            results = []
+            for text, wav in zip(texts, wavs):
+                duration = len(wav) / self.config.sample_rate
+                results.append(TTSResult(
+                    text=text,
+                    audio_data=wav,
+                    sample_rate=self.config.sample_rate,
+                    duration=duration,
+                    voice_id=voice_id
+                ))
+                logging.debug("TTS synthesis completed: %d chars -> %.2fs", len(text), duration)
             
-            # Adjust audio parameters
-            wav = self._adjust_audio_parameters(wav)
+            return results
             
-            duration = len(wav) / self.config.sample_rate
+        except Exception as e:
+            logging.error(f"TTS synthesis failed: {e}")
+            raise
+    
+    def _synthesize_blocking(self, texts: List[str], speaker: Optional[str]) -> List[np.ndarray]:
+        """Run the model and post-processing (called on the worker thread)"""
+        wavs: List[Optional[np.ndarray]] = [None] * len(texts)
+        
+        # One inference block for the whole batch, shortest texts first
+        with self._inference_context():
+            latents = None
+            if speaker is not None and self._supports_latents:
+                latents = self._get_voice_latents(speaker)
             
-            result = TTSResult(
+            for i in sorted(range(len(texts)), key=lambda i: len(texts[i])):
+                if latents is not None:
+                    # Synthesize from cached conditioning latents
+                    gpt_cond_latent, speaker_embedding = latents
+                    wav = self._get_tts_model().inference(
+                        texts[i], self.config.language, gpt_cond_latent, speaker_embedding
+                    )['wav']
+                else:
+                    # Synthesize with Coqui TTS
+                    wav = self.model.tts(text=texts[i], speaker=speaker)
+                
+                wavs[i] = self._postprocess(wav)
+        
+        return wavs
+    
+    def supports_streaming(self, voice_id: Optional[str] = None) -> bool:
+        """Whether synthesize_stream can yield audio before the utterance is complete"""
+        voice_id = voice_id or self.config.voice_id
+        return self._supports_streaming and voice_id != "default"
+    
+    async def synthesize_stream(self, text: str, voice_id: Optional[str] = None) -> AsyncIterator[TTSResult]:
+        """Synthesize speech from text, yielding audio chunks as they are generated
+        
+        Models without a streaming API yield a single complete result.
+        """
+        if not self.is_loaded:
+            await self.load_model()
+        
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+        
+        voice_id = voice_id or self.config.voice_id
+        if not self.supports_streaming(voice_id):
+            yield await self.synthesize(text, voice_id)
+            return
+        
+        # The worker thread hands chunks over through an asyncio queue (None ends the stream)
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        worker = loop.run_in_executor(self._executor, self._stream_blocking, text, voice_id, loop, chunks)
+        
+        while True:
+            item = await chunks.get()
+            if item is None:
+                break
+            wav, is_chunk = item
+            yield TTSResult(
                 text=text,
                 audio_data=wav,
                 sample_rate=self.config.sample_rate,
-                duration=duration,
-                voice_id=voice_id
+                duration=len(wav) / self.config.sample_rate,
+                voice_id=voice_id,
+                is_streaming_chunk=is_chunk
             )
-            
-            logging.debug(f"TTS synthesis completed: {len(text)} chars -> {duration:.2f}s")
-            return result
-            
-        except Exception as e:
-            logging.error(f"TTS synthesis failed: {e}")
-            raise
+        
+        # Re-raise worker errors
+        await worker
     
-    def _adjust_audio_parameters(self, wav: np.ndarray) -> np.ndarray:
-        """Adjust audio parameters"""
-        # Volume adjustment
-        wav = wav * self.config.volume
+    def _stream_blocking(self, text: str, speaker: str, loop: asyncio.AbstractEventLoop, chunks: asyncio.Queue):
+        """Run streaming inference and post each chunk to the event loop (worker thread)"""
+        try:
+            with self._inference_context():
+                latents = self._get_voice_latents(speaker)
+                if latents is None:
+                    # Unknown voice: fall back to a single complete result
+                    wav = self._synthesize_blocking([text], speaker)[0]
+                    loop.call_soon_threadsafe(chunks.put_nowait, (wav, False))
+                    return
+                
+                gpt_cond_latent, speaker_embedding = latents
+                for chunk in self._get_tts_model().inference_stream(
+                    text, self.config.language, gpt_cond_latent, speaker_embedding, stream_chunk_size=20
+                ):
+                    loop.call_soon_threadsafe(chunks.put_nowait, (self._postprocess(chunk), True))
+        finally:
+            loop.call_soon_threadsafe(chunks.put_nowait, None)
+    
+    def _inference_context(self) -> contextlib.ExitStack:
+        """Context for model calls: inference mode, plus autocast in half precision"""
+        stack = contextlib.ExitStack()
+        if HAS_TORCH_AUDIO:
+            stack.enter_context(torch.inference_mode())
+        if self.half_dtype is not None:
+            stack.enter_context(torch.autocast(device_type="cuda", dtype=self.half_dtype))
+        return stack
+    
+    def _postprocess(self, wav) -> np.ndarray:
+        """Convert model output to float32 and apply the audio parameters"""
+        # Stretch model tensors where they live (GPU when available)
+        if HAS_TORCH_AUDIO and isinstance(wav, torch.Tensor):
+            wav = wav.float()
+            if self.config.speed != 1.0 and wav.numel():
+                wav = self._time_stretch(wav)
+            return self._apply_gain(wav.cpu().numpy())
+        
+        # Convert to float32 NumPy array (no copy if it already is one;
+        # also upcasts half-precision output before post-processing)
+        wav = np.asarray(wav, dtype=np.float32)
+        
+        # Adjust audio parameters
+        return self._adjust_audio_parameters(wav)
+    
+    def _time_stretch(self, wav: "torch.Tensor") -> "torch.Tensor":
+        """Change speed without changing pitch (STFT phase vocoder)"""
+        n_fft, hop_length = self._STRETCH_N_FFT, self._STRETCH_HOP
+        if wav.shape[-1] <= n_fft // 2:
+            return wav
         
-        # Speed adjustment (simple implementation)
-        if self.config.speed != 1.0:
-            # For actual implementation, use more advanced time-stretching algorithms
-            target_length = int(len(wav) / self.config.speed)
-            if target_length > 0:
-                indices = np.linspace(0, len(wav) - 1, target_length)
-                wav = np.interp(indices, np.arange(len(wav)), wav)
+        device = self.device if self.device == "cuda" else "cpu"
+        wav = wav.to(device)
+        window = torch.hann_window(n_fft, device=device)
+        spec = torch.stft(wav, n_fft=n_fft, hop_length=hop_length, window=window, return_complex=True)
+        phase_advance = torch.linspace(0, math.pi * hop_length, spec.shape[-2], device=device)[..., None]
+        spec = torchaudio.functional.phase_vocoder(spec, rate=self.config.speed, phase_advance=phase_advance)
+        return torch.istft(
+            spec, n_fft=n_fft, hop_length=hop_length, window=window,
+            length=round(wav.shape[-1] / self.config.speed)
+        )
+    
+    def _adjust_audio_parameters(self, wav: np.ndarray) -> np.ndarray:
+        """Adjust audio parameters (float32 in, float32 out; may modify wav in place)"""
+        # Speed adjustment
+        if self.config.speed != 1.0 and len(wav):
+            if HAS_TORCH_AUDIO:
+                # Phase vocoder: changes speed without changing pitch
+                wav = self._time_stretch(torch.from_numpy(wav)).cpu().numpy()
+            elif HAS_LIBROSA:
+                # Phase vocoder: changes speed without changing pitch
+                wav = librosa.effects.time_stretch(wav, rate=self.config.speed).astype(np.float32, copy=False)
+            else:
+                # Fallback: linear resampling (also shifts pitch)
+                target_length = int(len(wav) / self.config.speed)
+                if target_length > 0:
+                    positions = np.linspace(0, len(wav) - 1, target_length, dtype=np.float32)
+                    wav = np.interp(positions, np.arange(len(wav), dtype=np.float32), wav).astype(np.float32)
         
-        # Prevent clipping
-        wav = np.clip(wav, -1.0, 1.0)
+        return self._apply_gain(wav)
+    
+    def _apply_gain(self, wav: np.ndarray) -> np.ndarray:
+        """Apply volume and clip to [-1, 1] (float32, in place)"""
+        # Volume adjustment and clipping in place (float32 scalars avoid upcasting)
+        if HAS_NUMBA:
+            wav = np.ascontiguousarray(wav)
+            _gain_clip(wav, np.float32(self.config.volume))
+        else:
+            np.multiply(wav, np.float32(self.config.volume), out=wav)
+            np.clip(wav, np.float32(-1.0), np.float32(1.0), out=wav)
         
         return wav
     
@@ -180,38 +570,81 @@ class TTSEngine:
             return ["default"]
 
 class AudioPlayer:
-    """Audio playback class"""
+    """Audio playback class
+    
+    Keeps one PortAudio output stream open and feeds it from a chunk queue
+    in the stream callback, so utterances play back to back without
+    reopening the device.
     
-    def __init__(self, device_index: Optional[int] = None):
+    The queue is a single-producer/single-consumer ring of preallocated
+    slots: play() only advances _head and the stream callback only advances
+    _tail, so the audio thread never waits on a lock.
+    """
+    
+    def __init__(self,
+                 device_index: Optional[int] = None,
+                 sample_rate: int = 22050,
+                 blocksize: int = 1024,
+                 queue_slots: int = 64):
         self.device_index = device_index
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize
         self.is_playing = False
-        self.playback_queue = Queue()
-        self.playback_thread = None
+        self.stream = None
+        
+        # Pending float32 chunks and the read offset into the oldest one
+        self._slots: List[Optional[np.ndarray]] = [None] * queue_slots
+        self._head = 0  # total chunks queued (written by play)
+        self._tail = 0  # total chunks consumed (written by the stream callback)
+        self._offset = 0
+        
+        # Callback status flags seen since start (logged from stop, not the audio thread)
+        self._status_count = 0
         
         if not HAS_SOUNDDEVICE:
             logging.warning("sounddevice not available, audio playback disabled")
     
     def start(self):
-        """Start audio playback thread"""
+        """Open and start the output stream"""
         if not HAS_SOUNDDEVICE:
             return
         
-        if self.playback_thread and self.playback_thread.is_alive():
+        if self.stream is not None:
             return
         
+        self.stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            blocksize=self.blocksize,
+            device=self.device_index,
+            channels=1,
+            dtype='float32',
+            callback=self._stream_callback
+        )
+        self._status_count = 0
+        self.stream.start()
         self.is_playing = True
-        self.playback_thread = threading.Thread(target=self._playback_worker)
-        self.playback_thread.start()
         
         logging.info("Audio player started")
     
     def stop(self):
-        """Stop audio playback thread"""
+        """Stop and close the output stream"""
         self.is_playing = False
         
-        if self.playback_thread and self.playback_thread.is_alive():
-            self.playback_thread.join(timeout=5.0)
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception as e:
+                logging.error(f"Error closing audio stream: {e}")
+            self.stream = None
+        
+        # The callback has stopped, so the consumer side can be reset here
+        self._slots = [None] * len(self._slots)
+        self._tail = self._head
+        self._offset = 0
         
+        if self._status_count:
+            logging.debug(f"Audio output reported {self._status_count} underflow/overflow callbacks")
         logging.info("Audio player stopped")
     
     def play(self, tts_result: TTSResult):
@@ -220,38 +653,67 @@ class AudioPlayer:
             logging.warning("Cannot play audio: sounddevice not available")
             return
         
-        self.playback_queue.put(tts_result)
+        audio = np.asarray(tts_result.audio_data, dtype=np.float32).reshape(-1)
+        
+        # Resample once to the stream rate (linear interpolation)
+        if tts_result.sample_rate != self.sample_rate and len(audio):
+            target_length = max(1, round(len(audio) * self.sample_rate / tts_result.sample_rate))
+            positions = np.linspace(0, len(audio) - 1, target_length, dtype=np.float32)
+            audio = np.interp(positions, np.arange(len(audio), dtype=np.float32), audio).astype(np.float32)
+        
+        if self._head - self._tail >= len(self._slots):
+            logging.warning("Audio playback queue full, dropping chunk")
+            return
+        
+        # Fill the slot before publishing it by advancing _head
+        self._slots[self._head % len(self._slots)] = audio
+        self._head += 1
     
-    def _playback_worker(self):
-        """Audio playback worker"""
-        while self.is_playing:
-            try:
-                tts_result = self.playback_queue.get(timeout=0.1)
-                
-                # Play audio
-                sd.play(
-                    tts_result.audio_data,
-                    samplerate=tts_result.sample_rate,
-                    device=self.device_index
-                )
-                sd.wait()  # Wait for playback completion
-                
-            except Empty:
-                continue
-            except Exception as e:
-                logging.error(f"Audio playback error: {e}")
+    def _stream_callback(self, outdata, frames, time_info, status):
+        """Output stream callback (runs on the PortAudio thread; no logging or locks)"""
+        if status:
+            self._status_count += 1
+        
+        out = outdata[:, 0]
+        written = 0
+        while written < frames and self._tail < self._head:
+            slot = self._tail % len(self._slots)
+            chunk = self._slots[slot]
+            n = min(frames - written, len(chunk) - self._offset)
+            out[written:written + n] = chunk[self._offset:self._offset + n]
+            written += n
+            self._offset += n
+            if self._offset == len(chunk):
+                self._slots[slot] = None
+                self._offset = 0
+                self._tail += 1
+        
+        # Silence on underrun
+        out[written:] = 0.0
 
 class RealtimeTTS:
-    """Real-time TTS main class"""
+    """Real-time TTS main class
+    
+    Incoming texts are queued and gathered for up to batch_window seconds
+    (or max_batch_size texts), then synthesized in a single worker job.
+    """
     
     def __init__(self, 
                  config: TTSConfig,
                  audio_device_index: Optional[int] = None,
-                 enable_playback: bool = True):
+                 enable_playback: bool = True,
+                 batch_window: float = 0.05,
+                 max_batch_size: int = 8):
         
         self.config = config
         self.tts_engine = TTSEngine(config)
-        self.audio_player = AudioPlayer(audio_device_index) if enable_playback else None
+        self.audio_player = AudioPlayer(audio_device_index, config.sample_rate) if enable_playback else None
+        
+        # Micro-batching
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._text_queue: Optional[asyncio.Queue] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
         
         # Callback
         self.tts_callback: Optional[Callable[[TTSResult], None]] = None
@@ -271,6 +733,9 @@ class RealtimeTTS:
         if self.audio_player:
             self.audio_player.start()
         
+        self._text_queue = asyncio.Queue()
+        self._dispatcher_task = asyncio.create_task(self._dispatcher())
+        
         self.is_running = True
         logging.info("Realtime TTS started")
     
@@ -278,6 +743,10 @@ class RealtimeTTS:
         """Stop real-time TTS"""
         self.is_running = False
         
+        if self._dispatcher_task:
+            self._dispatcher_task.cancel()
+            self._dispatcher_task = None
+        
         if self.audio_player:
             self.audio_player.stop()
         
@@ -292,40 +761,63 @@ class RealtimeTTS:
         if not self.is_running:
             return
         
-        try:
-            # Synthesize speech from text
-            tts_result = await self.tts_engine.synthesize(result.text)
-            
-            # Execute callback
-            if self.tts_callback:
-                self.tts_callback(tts_result)
-            
-            # Play audio
-            if self.audio_player:
-                self.audio_player.play(tts_result)
-            
-        except Exception as e:
-            logging.error(f"TTS processing error: {e}")
+        await self._text_queue.put(result.text)
     
     async def process_subtitle_segment(self, segment: SubtitleSegment):
         """Process subtitle segment with TTS"""
         if not self.is_running:
             return
         
-        try:
-            # Synthesize speech from text
-            tts_result = await self.tts_engine.synthesize(segment.text)
+        await self._text_queue.put(segment.text)
+    
+    async def _dispatcher(self):
+        """Gather queued texts into batches and synthesize them in arrival order"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._text_queue.get()]
+            deadline = loop.time() + self.batch_window
             
-            # Execute callback
-            if self.tts_callback:
-                self.tts_callback(tts_result)
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._text_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-            # Play audio
-            if self.audio_player:
-                self.audio_player.play(tts_result)
+            await self._process_batch(batch)
+    
+    async def _process_batch(self, texts: List[str]):
+        """Synthesize a batch of texts and deliver the results in arrival order"""
+        texts = [text for text in texts if text.strip()]
+        if not texts:
+            return
+        
+        try:
+            if self.tts_engine.supports_streaming():
+                # Start playback as soon as the first chunk of each utterance is ready
+                for text in texts:
+                    async for result in self.tts_engine.synthesize_stream(text):
+                        self._deliver(result)
+            else:
+                # Synthesize speech from text
+                for result in await self.tts_engine.synthesize_batch(texts):
+                    self._deliver(result)
             
         except Exception as e:
             logging.error(f"TTS processing error: {e}")
+    
+    def _deliver(self, result: TTSResult):
+        """Pass a TTS result to the callback and the audio player"""
+        # Execute callback
+        if self.tts_callback:
+            self.tts_callback(result)
+        
+        # Play audio
+        if self.audio_player:
+            self.audio_player.play(result)
 
 # Utility functions
 def create_japanese_tts_config(**kwargs) -> TTSConfig:
@@ -6,20 +6,37 @@ Web interface for real-time speech recognition subtitle system
 """
 
 import asyncio
+import hashlib
 import logging
 import json
 import os
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, NamedTuple, Tuple, Deque
 from datetime import datetime
 
 # FastAPI and WebSocket
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException, File, UploadFile
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
 import uvicorn
 
+# Fast JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Binary WebSocket frames
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 # Project modules
 from .realtime_transcriber import RealtimeTranscriber, TranscriptionResult
 from .subtitle_manager import SubtitleManager
@@ -32,47 +49,106 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def _dumps(message: Dict[str, Any]) -> bytes:
+    """Serialize a WebSocket message to UTF-8 JSON once for all recipients"""
+    if HAS_ORJSON:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False).encode('utf-8')
+
+class WirePayload(NamedTuple):
+    """WebSocket message pre-encoded for JSON and MessagePack clients"""
+    json: bytes
+    msgpack: Optional[bytes]
+
+def _encode(message: Dict[str, Any]) -> WirePayload:
+    """Encode a WebSocket message once per wire format"""
+    packed = msgpack.packb(message, use_bin_type=True) if HAS_MSGPACK else None
+    return WirePayload(_dumps(message), packed)
+
+# Constant broadcast payloads, serialized once
+RECORDING_STARTED_MESSAGE = _encode({
+    "type": "status",
+    "status": "recording",
+    "message": "Recording started"
+})
+RECORDING_STOPPED_MESSAGE = _encode({
+    "type": "status",
+    "status": "stopped",
+    "message": "Recording stopped"
+})
+CLEARED_MESSAGE = _encode({
+    "type": "clear",
+    "message": "Subtitles cleared"
+})
+PONG_MESSAGE = _encode({"type": "pong"})
+
+# Transcription message envelopes around a pre-serialized segment
+_TRANSCRIPTION_JSON_PREFIX = b'{"type":"transcription","segment":'
+_TRANSCRIPTION_MSGPACK_PREFIX = (
+    b'\x82' + msgpack.packb("type") + msgpack.packb("transcription") + msgpack.packb("segment")
+    if HAS_MSGPACK else None
+)
+
+def _encode_transcription(segment_json: bytes, segment: Dict[str, Any]) -> WirePayload:
+    """Wrap a pre-serialized segment in a transcription message"""
+    packed = None
+    if HAS_MSGPACK:
+        packed = _TRANSCRIPTION_MSGPACK_PREFIX + msgpack.packb(segment, use_bin_type=True)
+    return WirePayload(_TRANSCRIPTION_JSON_PREFIX + segment_json + b'}', packed)
+
+# Default /api/subtitles count (the only one whose response is cached)
+DEFAULT_SUBTITLES_COUNT = 50
+
 class WebSocketManager:
     """WebSocket connection manager class"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self.msgpack_connections: Set[WebSocket] = set()
     
-    async def connect(self, websocket: WebSocket):
-        """Add WebSocket connection"""
+    async def connect(self, websocket: WebSocket, binary: bool = False):
+        """Add WebSocket connection (binary=True for MessagePack clients)"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        if binary:
+            self.msgpack_connections.add(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self.msgpack_connections.discard(websocket)
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
-    async def send_personal_message(self, message: str, websocket: WebSocket):
-        """Send personal message"""
+    def _frame(self, message: WirePayload, websocket: WebSocket) -> bytes:
+        """Pick the pre-encoded frame matching the connection's wire format"""
+        if websocket in self.msgpack_connections:
+            return message.msgpack
+        return message.json
+    
+    async def send_personal_message(self, message: WirePayload, websocket: WebSocket):
+        """Send personal message (pre-encoded payload)"""
         try:
-            await websocket.send_text(message)
+            await websocket.send_bytes(self._frame(message, websocket))
         except Exception as e:
             logger.error(f"Failed to send personal message: {e}")
     
-    async def broadcast(self, message: str):
-        """Broadcast to all connections"""
+    async def broadcast(self, message: WirePayload):
+        """Broadcast a pre-encoded payload to all connections concurrently"""
         if not self.active_connections:
             return
         
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast message: {e}")
-                disconnected.append(connection)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(self._frame(message, connection)) for connection in connections),
+            return_exceptions=True
+        )
         
         # Remove disconnected connections
-        for conn in disconnected:
-            self.disconnect(conn)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast message: {result}")
+                self.disconnect(connection)
 
 class RealtimeSubtitleApp:
     """Real-time subtitle web application"""
@@ -85,6 +161,9 @@ class RealtimeSubtitleApp:
             version="1.0.0"
         )
         
+        # Compress text responses (subtitle exports, /api/subtitles) for gzip-capable clients
+        self.app.add_middleware(GZipMiddleware, minimum_size=512)
+        
         # Setup paths
         self.base_dir = Path(__file__).parent.parent
         self.static_dir = self.base_dir / "static"
@@ -98,6 +177,9 @@ class RealtimeSubtitleApp:
         
         # Components
         self.transcriber: Optional[RealtimeTranscriber] = None
+        # Loaded transcribers keyed by (model_size, language), least recently used first
+        self._transcriber_cache: "OrderedDict[Tuple[str, Optional[str]], RealtimeTranscriber]" = OrderedDict()
+        self.transcriber_cache_size = 2
         self.subtitle_manager: Optional[SubtitleManager] = None
         self.websocket_manager = WebSocketManager()
         
@@ -105,12 +187,54 @@ class RealtimeSubtitleApp:
         self.is_recording = False
         self.current_device_index: Optional[int] = None
         
+        # Broadcast handoff from the transcriber thread to the event loop
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+        
+        # /api/subtitles response for DEFAULT_SUBTITLES_COUNT: count -> (etag, payload)
+        self._subtitles_cache: Dict[int, Tuple[str, bytes]] = {}
+        
+        # Segment JSON fragments serialized once at ingest
+        self._segment_payloads: Deque[bytes] = deque()
+        
         # Setup routes and static files
+        self._setup_events()
         self._setup_routes()
         self._setup_static_files()
         
         logger.info("RealtimeSubtitleApp initialized")
     
+    def _setup_events(self):
+        """Setup application lifecycle events"""
+        
+        @self.app.on_event("startup")
+        async def on_startup():
+            """Capture the server loop and start the broadcast consumer"""
+            self.loop = asyncio.get_running_loop()
+            self._broadcast_queue = asyncio.Queue()
+            self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+        
+        @self.app.on_event("shutdown")
+        async def on_shutdown():
+            """Stop the broadcast consumer"""
+            if self._broadcast_task:
+                self._broadcast_task.cancel()
+                try:
+                    await self._broadcast_task
+                except asyncio.CancelledError:
+                    pass
+                self._broadcast_task = None
+    
+    async def _broadcast_loop(self):
+        """Broadcast payloads queued by the transcriber thread, in order"""
+        while True:
+            payload = await self._broadcast_queue.get()
+            try:
+                await self.websocket_manager.broadcast(payload)
+            except Exception as e:
+                logger.error(f"Broadcast failed: {e}")
+    
     def _setup_static_files(self):
         """Setup static files and templates"""
         # Static files
@@ -128,8 +252,9 @@ class RealtimeSubtitleApp:
             return self.templates.TemplateResponse("index.html", {"request": request})
         
         @self.app.websocket("/ws")
+        @self.app.websocket("/ws-json")
         async def websocket_endpoint(websocket: WebSocket):
-            """WebSocket endpoint"""
+            """WebSocket endpoint (JSON, kept for debugging and older clients)"""
             await self.websocket_manager.connect(websocket)
             try:
                 while True:
@@ -142,12 +267,28 @@ class RealtimeSubtitleApp:
                 logger.error(f"WebSocket error: {e}")
                 self.websocket_manager.disconnect(websocket)
         
+        if HAS_MSGPACK:
+            @self.app.websocket("/ws-bin")
+            async def websocket_binary_endpoint(websocket: WebSocket):
+                """WebSocket endpoint (binary MessagePack frames)"""
+                await self.websocket_manager.connect(websocket, binary=True)
+                try:
+                    while True:
+                        data = await websocket.receive_bytes()
+                        message = msgpack.unpackb(data, raw=False)
+                        await self._handle_websocket_message(message, websocket)
+                except WebSocketDisconnect:
+                    self.websocket_manager.disconnect(websocket)
+                except Exception as e:
+                    logger.error(f"WebSocket error: {e}")
+                    self.websocket_manager.disconnect(websocket)
+        
         @self.app.get("/api/devices")
         async def get_audio_devices():
             """Get available audio devices list"""
             try:
                 if not self.transcriber:
-                    self.transcriber = RealtimeTranscriber()
+                    self.transcriber = self._get_transcriber("base", None)
                 
                 devices = self.transcriber.get_available_devices()
                 return {"devices": devices}
@@ -167,12 +308,13 @@ class RealtimeSubtitleApp:
                 if self.is_recording:
                     return {"error": "Already recording"}
                 
-                # Initialize components
-                self.transcriber = RealtimeTranscriber(
-                    model_size=model_size,
-                    language=language
-                )
+                # Initialize components (reuses an already loaded model)
+                self.transcriber = self._get_transcriber(model_size, language)
+                if self.subtitle_manager:
+                    self.subtitle_manager.close()
                 self.subtitle_manager = SubtitleManager(output_dir=str(self.outputs_dir))
+                self._segment_payloads = deque(maxlen=self.subtitle_manager.max_segments)
+                self._invalidate_subtitles_cache()
                 
                 # Set callback
                 self.transcriber.set_transcription_callback(self._on_transcription)
@@ -183,11 +325,7 @@ class RealtimeSubtitleApp:
                 self.current_device_index = device_index
                 
                 # Broadcast status
-                await self.websocket_manager.broadcast(json.dumps({
-                    "type": "status",
-                    "status": "recording",
-                    "message": "Recording started"
-                }))
+                await self.websocket_manager.broadcast(RECORDING_STARTED_MESSAGE)
                 
                 return {"status": "started"}
                 
@@ -209,11 +347,7 @@ class RealtimeSubtitleApp:
                 self.is_recording = False
                 
                 # Broadcast status
-                await self.websocket_manager.broadcast(json.dumps({
-                    "type": "status",
-                    "status": "stopped",
-                    "message": "Recording stopped"
-                }))
+                await self.websocket_manager.broadcast(RECORDING_STOPPED_MESSAGE)
                 
                 return {"status": "stopped"}
                 
@@ -231,15 +365,31 @@ class RealtimeSubtitleApp:
             }
         
         @self.app.get("/api/subtitles")
-        async def get_subtitles(count: int = 50):
-            """Get latest subtitle segments"""
+        async def get_subtitles(request: Request, count: int = DEFAULT_SUBTITLES_COUNT):
+            """Get latest subtitle segments (count <= 0 returns all of them)"""
             if not self.subtitle_manager:
                 return {"segments": []}
             
-            segments = self.subtitle_manager.get_recent_segments(count)
-            return {
-                "segments": [segment.to_dict() for segment in segments]
-            }
+            cacheable = count == DEFAULT_SUBTITLES_COUNT
+            max_segments = self.subtitle_manager.max_segments
+            count = max_segments if count <= 0 else min(count, max_segments)
+            
+            # Bound to the current cache so a concurrent invalidation drops this entry
+            cache = self._subtitles_cache
+            cached = cache.get(count)
+            if cached is None:
+                fragments = list(self._segment_payloads)
+                recent = fragments[max(0, len(fragments) - count):]
+                payload = b'{"segments":[' + b','.join(recent) + b']}'
+                etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+                cached = (etag, payload)
+                if cacheable:
+                    cache[count] = cached
+            
+            etag, payload = cached
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            return Response(content=payload, media_type="application/json", headers={"ETag": etag})
         
         @self.app.post("/api/export/{format}")
         async def export_subtitles(format: str):
@@ -253,16 +403,21 @@ class RealtimeSubtitleApp:
                 elif format == "vtt":
                     filepath = self.subtitle_manager.export_webvtt()
                 elif format == "json":
-                    filepath = self.subtitle_manager.export_json()
+                    filepath = self.subtitle_manager.export_json(pretty=True)
                 elif format == "txt":
                     filepath = self.subtitle_manager.export_txt()
                 else:
                     raise HTTPException(status_code=400, detail="Unsupported format")
                 
+                # Content-based ETag so identical exports are recognized by caches
+                with open(filepath, 'rb') as f:
+                    etag = f'"{hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=8)).hexdigest()}"'
+                
                 return FileResponse(
                     path=filepath,
                     filename=Path(filepath).name,
-                    media_type='application/octet-stream'
+                    media_type='application/octet-stream',
+                    headers={"ETag": etag, "Cache-Control": "public, max-age=60"}
                 )
                 
             except Exception as e:
@@ -274,12 +429,11 @@ class RealtimeSubtitleApp:
             """Clear subtitle data"""
             if self.subtitle_manager:
                 self.subtitle_manager.clear_segments()
+                self._segment_payloads.clear()
+                self._invalidate_subtitles_cache()
                 
                 # Broadcast clear event
-                await self.websocket_manager.broadcast(json.dumps({
-                    "type": "clear",
-                    "message": "Subtitles cleared"
-                }))
+                await self.websocket_manager.broadcast(CLEARED_MESSAGE)
             
             return {"status": "cleared"}
     
@@ -288,20 +442,33 @@ class RealtimeSubtitleApp:
         message_type = message.get("type")
         
         if message_type == "ping":
-            await self.websocket_manager.send_personal_message(
-                json.dumps({"type": "pong"}), 
-                websocket
-            )
+            await self.websocket_manager.send_personal_message(PONG_MESSAGE, websocket)
         elif message_type == "get_status":
             status = {
                 "type": "status",
                 "is_recording": self.is_recording,
                 "device_index": self.current_device_index
             }
-            await self.websocket_manager.send_personal_message(
-                json.dumps(status), 
-                websocket
-            )
+            await self.websocket_manager.send_personal_message(_encode(status), websocket)
+    
+    def _get_transcriber(self, model_size: str, language: Optional[str]) -> RealtimeTranscriber:
+        """Get a cached transcriber for (model_size, language), creating it if needed"""
+        key = (model_size, language)
+        transcriber = self._transcriber_cache.pop(key, None)
+        if transcriber is None:
+            transcriber = RealtimeTranscriber(model_size=model_size, language=language)
+        self._transcriber_cache[key] = transcriber
+        
+        # Evict least recently used transcribers to cap model memory
+        while len(self._transcriber_cache) > self.transcriber_cache_size:
+            _, evicted = self._transcriber_cache.popitem(last=False)
+            evicted.close()
+        
+        return transcriber
+    
+    def _invalidate_subtitles_cache(self):
+        """Drop cached /api/subtitles responses (safe from any thread)"""
+        self._subtitles_cache = {}
     
     def _on_transcription(self, result: TranscriptionResult):
         """Transcription result callback"""
@@ -310,14 +477,18 @@ class RealtimeSubtitleApp:
             if self.subtitle_manager:
                 segment = self.subtitle_manager.add_transcription(result)
                 
-                # Broadcast to all connected clients
-                message = {
-                    "type": "transcription",
-                    "segment": segment.to_dict()
-                }
+                # Serialize the segment once for both polling and broadcast
+                segment_dict = segment.to_dict()
+                segment_json = _dumps(segment_dict)
+                self._segment_payloads.append(segment_json)
+                self._invalidate_subtitles_cache()
                 
-                # Use asyncio to run the coroutine
-                asyncio.create_task(self.websocket_manager.broadcast(json.dumps(message)))
+                # Hand off to the event loop; this runs on the transcriber thread
+                if self.loop is not None and self._broadcast_queue is not None:
+                    self.loop.call_soon_threadsafe(
+                        self._broadcast_queue.put_nowait,
+                        _encode_transcription(segment_json, segment_dict)
+                    )
                 
         except Exception as e:
             logger.error(f"Error handling transcription result: {e}")
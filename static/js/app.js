@@ -91,18 +91,35 @@ class RealtimeSubtitlesApp {
     
     setupWebSocket() {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${window.location.host}/ws`;
+        // Prefer binary MessagePack frames when the decoder is available
+        if (this.useMsgpack === undefined) {
+            this.useMsgpack = typeof MessagePack !== 'undefined';
+        }
+        const wsPath = this.useMsgpack ? '/ws-bin' : '/ws';
+        const wsUrl = `${protocol}//${window.location.host}${wsPath}`;
         
         this.ws = new WebSocket(wsUrl);
+        this.ws.binaryType = 'arraybuffer';
+        this.textDecoder = new TextDecoder('utf-8');
+        this.wsOpened = false;
         
         this.ws.onopen = () => {
             console.log('WebSocket connected');
+            this.wsOpened = true;
             this.updateStatus('Ready', 'ready');
         };
         
         this.ws.onmessage = (event) => {
             try {
-                const data = JSON.parse(event.data);
+                let data;
+                if (typeof event.data === 'string') {
+                    data = JSON.parse(event.data);
+                } else if (this.useMsgpack) {
+                    data = MessagePack.decode(new Uint8Array(event.data));
+                } else {
+                    // JSON endpoint sends binary frames of UTF-8 JSON
+                    data = JSON.parse(this.textDecoder.decode(event.data));
+                }
                 this.handleWebSocketMessage(data);
             } catch (error) {
                 console.error('Error parsing WebSocket message:', error);
@@ -111,6 +128,10 @@ class RealtimeSubtitlesApp {
         
         this.ws.onclose = () => {
             console.log('WebSocket disconnected');
+            // Server without MessagePack support rejects /ws-bin; fall back to JSON
+            if (this.useMsgpack && !this.wsOpened) {
+                this.useMsgpack = false;
+            }
             this.updateStatus('Disconnected', 'error');
             
             // Attempt to reconnect after 3 seconds
@@ -127,6 +148,13 @@ class RealtimeSubtitlesApp {
         };
     }
     
+    sendWebSocketMessage(message) {
+        if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
+            return;
+        }
+        this.ws.send(this.useMsgpack ? MessagePack.encode(message) : JSON.stringify(message));
+    }
+    
     handleWebSocketMessage(data) {
         switch (data.type) {
             case 'transcription':
@@ -480,8 +508,6 @@ document.addEventListener('DOMContentLoaded', () => {
     
     // Periodic WebSocket health check
     setInterval(() => {
-        if (window.app.ws && window.app.ws.readyState === WebSocket.OPEN) {
-            window.app.ws.send(JSON.stringify({ type: 'ping' }));
-        }
+        window.app.sendWebSocketMessage({ type: 'ping' });
     }, 30000); // Every 30 seconds
 });
\ No newline at end of file
@@ -0,0 +1,205 @@
+// Real-time Whisper Subtitles - MessagePack codec for the /ws-bin endpoint
+//
+// Covers the types the server's msgpack.packb produces (nil, booleans, ints,
+// floats, str, bin, arrays, maps); ext types are rejected. Exposes the same
+// MessagePack.encode/decode globals app.js feature-detects.
+
+const MessagePack = (() => {
+    const textEncoder = new TextEncoder();
+    const textDecoder = new TextDecoder('utf-8');
+    
+    class Decoder {
+        constructor(bytes) {
+            this.bytes = bytes;
+            this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+            this.pos = 0;
+        }
+        
+        take(length) {
+            const start = this.pos;
+            this.pos += length;
+            if (this.pos > this.bytes.length) {
+                throw new RangeError('MessagePack: unexpected end of data');
+            }
+            return start;
+        }
+        
+        str(length) {
+            const start = this.take(length);
+            return textDecoder.decode(this.bytes.subarray(start, start + length));
+        }
+        
+        bin(length) {
+            const start = this.take(length);
+            return this.bytes.slice(start, start + length);
+        }
+        
+        array(length) {
+            const items = new Array(length);
+            for (let i = 0; i < length; i++) {
+                items[i] = this.read();
+            }
+            return items;
+        }
+        
+        map(length) {
+            const object = {};
+            for (let i = 0; i < length; i++) {
+                const key = this.read();
+                object[key] = this.read();
+            }
+            return object;
+        }
+        
+        read() {
+            const view = this.view;
+            const type = view.getUint8(this.take(1));
+            
+            if (type <= 0x7f) return type;
+            if (type <= 0x8f) return this.map(type & 0x0f);
+            if (type <= 0x9f) return this.array(type & 0x0f);
+            if (type <= 0xbf) return this.str(type & 0x1f);
+            if (type >= 0xe0) return type - 0x100;
+            
+            switch (type) {
+                case 0xc0: return null;
+                case 0xc2: return false;
+                case 0xc3: return true;
+                case 0xc4: return this.bin(view.getUint8(this.take(1)));
+                case 0xc5: return this.bin(view.getUint16(this.take(2)));
+                case 0xc6: return this.bin(view.getUint32(this.take(4)));
+                case 0xca: return view.getFloat32(this.take(4));
+                case 0xcb: return view.getFloat64(this.take(8));
+                case 0xcc: return view.getUint8(this.take(1));
+                case 0xcd: return view.getUint16(this.take(2));
+                case 0xce: return view.getUint32(this.take(4));
+                case 0xcf: return Number(view.getBigUint64(this.take(8)));
+                case 0xd0: return view.getInt8(this.take(1));
+                case 0xd1: return view.getInt16(this.take(2));
+                case 0xd2: return view.getInt32(this.take(4));
+                case 0xd3: return Number(view.getBigInt64(this.take(8)));
+                case 0xd9: return this.str(view.getUint8(this.take(1)));
+                case 0xda: return this.str(view.getUint16(this.take(2)));
+                case 0xdb: return this.str(view.getUint32(this.take(4)));
+                case 0xdc: return this.array(view.getUint16(this.take(2)));
+                case 0xdd: return this.array(view.getUint32(this.take(4)));
+                case 0xde: return this.map(view.getUint16(this.take(2)));
+                case 0xdf: return this.map(view.getUint32(this.take(4)));
+                default:
+                    throw new TypeError(`MessagePack: unsupported type 0x${type.toString(16)}`);
+            }
+        }
+    }
+    
+    class Encoder {
+        constructor() {
+            this.bytes = new Uint8Array(256);
+            this.view = new DataView(this.bytes.buffer);
+            this.pos = 0;
+        }
+        
+        reserve(length) {
+            if (this.pos + length > this.bytes.length) {
+                const grown = new Uint8Array(Math.max(this.bytes.length * 2, this.pos + length));
+                grown.set(this.bytes);
+                this.bytes = grown;
+                this.view = new DataView(grown.buffer);
+            }
+            const start = this.pos;
+            this.pos += length;
+            return start;
+        }
+        
+        // Write a type byte, then value (if any) with the given DataView setter
+        put(type, setter = null, size = 0, value = 0) {
+            const start = this.reserve(1 + size);
+            this.view.setUint8(start, type);
+            if (setter !== null) {
+                this.view[setter](start + 1, value);
+            }
+        }
+        
+        raw(bytes) {
+            const start = this.reserve(bytes.length);  // may replace this.bytes
+            this.bytes.set(bytes, start);
+        }
+        
+        header(length, fix, fixMax, type8, type16, type32) {
+            if (fix !== null && length <= fixMax) {
+                this.put(fix | length);
+            } else if (type8 !== null && length <= 0xff) {
+                this.put(type8, 'setUint8', 1, length);
+            } else if (length <= 0xffff) {
+                this.put(type16, 'setUint16', 2, length);
+            } else {
+                this.put(type32, 'setUint32', 4, length);
+            }
+        }
+        
+        integer(value) {
+            if (value >= 0) {
+                if (value <= 0x7f) this.put(value);
+                else if (value <= 0xff) this.put(0xcc, 'setUint8', 1, value);
+                else if (value <= 0xffff) this.put(0xcd, 'setUint16', 2, value);
+                else if (value <= 0xffffffff) this.put(0xce, 'setUint32', 4, value);
+                else this.put(0xcf, 'setBigUint64', 8, BigInt(value));
+            } else {
+                if (value >= -0x20) this.put(value & 0xff);
+                else if (value >= -0x80) this.put(0xd0, 'setInt8', 1, value);
+                else if (value >= -0x8000) this.put(0xd1, 'setInt16', 2, value);
+                else if (value >= -0x80000000) this.put(0xd2, 'setInt32', 4, value);
+                else this.put(0xd3, 'setBigInt64', 8, BigInt(value));
+            }
+        }
+        
+        write(value) {
+            if (value === null || value === undefined) {
+                this.put(0xc0);
+            } else if (typeof value === 'boolean') {
+                this.put(value ? 0xc3 : 0xc2);
+            } else if (typeof value === 'number') {
+                if (Number.isSafeInteger(value)) {
+                    this.integer(value);
+                } else {
+                    this.put(0xcb, 'setFloat64', 8, value);
+                }
+            } else if (typeof value === 'string') {
+                const encoded = textEncoder.encode(value);
+                this.header(encoded.length, 0xa0, 0x1f, 0xd9, 0xda, 0xdb);
+                this.raw(encoded);
+            } else if (value instanceof Uint8Array) {
+                this.header(value.length, null, 0, 0xc4, 0xc5, 0xc6);
+                this.raw(value);
+            } else if (Array.isArray(value)) {
+                this.header(value.length, 0x90, 0x0f, null, 0xdc, 0xdd);
+                value.forEach(item => this.write(item));
+            } else if (typeof value === 'object') {
+                const keys = Object.keys(value);
+                this.header(keys.length, 0x80, 0x0f, null, 0xde, 0xdf);
+                keys.forEach(key => {
+                    this.write(key);
+                    this.write(value[key]);
+                });
+            } else {
+                throw new TypeError(`MessagePack: cannot encode ${typeof value}`);
+            }
+        }
+    }
+    
+    return {
+        decode(bytes) {
+            const decoder = new Decoder(bytes);
+            const value = decoder.read();
+            if (decoder.pos !== bytes.length) {
+                throw new RangeError('MessagePack: trailing data');
+            }
+            return value;
+        },
+        
+        encode(value) {
+            const encoder = new Encoder();
+            encoder.write(value);
+            return encoder.bytes.slice(0, encoder.pos);
+        }
+    };
+})();
@@ -5,34 +5,50 @@ Test Script for Real-time Whisper Subtitles
 Testing script for the real-time speech recognition system
 """
 
+import io
 import sys
-import time
 import logging
 import asyncio
+import threading
+import functools
+import importlib.util
+from collections import deque
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.realtime_transcriber import RealtimeTranscriber, TranscriptionResult
-from src.subtitle_manager import SubtitleManager
-from src.web_interface import RealtimeSubtitleApp
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging (one handler with a prebuilt formatter on the root logger)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.getLogger().addHandler(_log_handler)
+logging.getLogger().setLevel(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
-def test_transcriber():
+async def test_transcriber():
     """Test the real-time transcriber"""
     print("=== Testing Real-time Transcriber ===")
     
+    from src.realtime_transcriber import RealtimeTranscriber, TranscriptionResult
+    
+    # The callback runs on the transcriber thread; it only queues results and
+    # the event loop prints them, so stdout never stalls the decoder
+    results = deque(maxlen=256)
+    loop = asyncio.get_running_loop()
+    first_result = asyncio.Event()
+    
     def on_transcription(result: TranscriptionResult):
-        print(f"[{result.start_time:.2f}-{result.end_time:.2f}] {result.text}")
-        print(f"  Language: {result.language}, Confidence: {result.confidence:.2f}")
+        results.append(result)
+        if not first_result.is_set():
+            loop.call_soon_threadsafe(first_result.set)
+    
+    def print_results():
+        while results:
+            result = results.popleft()
+            print(f"[{result.start_time:.2f}-{result.end_time:.2f}] {result.text}")
+            print(f"  Language: {result.language}, Confidence: {result.confidence:.2f}")
     
     try:
         # Initialize transcriber
@@ -49,17 +65,27 @@ def test_transcriber():
             print("No audio devices found. Testing skipped.")
             return
         
-        print("\nStarting transcription test (10 seconds)...")
+        print("\nStarting transcription test (up to 10 seconds)...")
         print("Please speak into your microphone...")
         
         # Start transcription
         transcriber.start()
         
-        # Wait for 10 seconds
-        time.sleep(10)
+        try:
+            # Finish early once recognition produces output
+            await asyncio.wait_for(first_result.wait(), timeout=10)
+            
+            # Capture a few more results
+            deadline = loop.time() + 3
+            while loop.time() < deadline:
+                print_results()
+                await asyncio.sleep(0.05)
+        except asyncio.TimeoutError:
+            print("No speech recognized within 10 seconds.")
         
         # Stop transcription
         transcriber.stop()
+        print_results()
         print("Transcription test completed!")
         
     except Exception as e:
@@ -70,6 +96,9 @@ def test_subtitle_manager():
     print("\n=== Testing Subtitle Manager ===")
     
     try:
+        from src.realtime_transcriber import TranscriptionResult
+        from src.subtitle_manager import SubtitleManager
+        
         # Create manager
         manager = SubtitleManager(output_dir="test_outputs")
         
@@ -87,23 +116,14 @@ def test_subtitle_manager():
         # Test exports
         print("\nTesting exports...")
         
+        # JSON, TXT and SRT written in a single pass over the segments
         try:
-            json_file = manager.export_json("test_subtitles.json")
+            json_file, txt_file, srt_file = manager.export_all("test_subtitles")
             print(f"JSON exported: {json_file}")
-        except Exception as e:
-            print(f"JSON export failed: {e}")
-        
-        try:
-            txt_file = manager.export_txt("test_subtitles.txt")
             print(f"TXT exported: {txt_file}")
-        except Exception as e:
-            print(f"TXT export failed: {e}")
-        
-        try:
-            srt_file = manager.export_srt("test_subtitles.srt")
             print(f"SRT exported: {srt_file}")
         except Exception as e:
-            print(f"SRT export failed: {e}")
+            print(f"Export failed: {e}")
         
         # Show statistics
         stats = manager.get_statistics()
@@ -122,6 +142,8 @@ def test_web_interface():
     print("\n=== Testing Web Interface ===")
     
     try:
+        from src.web_interface import RealtimeSubtitleApp
+        
         # Initialize web app
         app_instance = RealtimeSubtitleApp()
         print("Web interface initialized successfully!")
@@ -145,6 +167,14 @@ async def test_tts_integration():
     """Test TTS integration (if available)"""
     print("\n=== Testing TTS Integration ===")
     
+    # Filesystem-only checks, so a missing TTS stack doesn't cost a torch import
+    if importlib.util.find_spec("src.tts_integration") is None:
+        print("TTS module not present, skipping")
+        return
+    if importlib.util.find_spec("TTS") is None:
+        print("TTS libraries not available: Coqui TTS is not installed, skipping")
+        return
+    
     try:
         from src.tts_integration import TTSEngine, TTSConfig, create_english_tts_config
         
@@ -164,27 +194,67 @@ async def test_tts_integration():
     except Exception as e:
         print(f"TTS integration test failed: {e}")
 
+@functools.lru_cache(maxsize=None)
+def _probe_gpus_nvml() -> Optional[Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]]:
+    """List (name, compute capability) per GPU via NVML, without creating a
+    CUDA context; returns None if NVML is unavailable"""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    
+    try:
+        gpus = []
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode()
+            try:
+                capability = tuple(pynvml.nvmlDeviceGetCudaComputeCapability(handle))
+            except Exception:
+                capability = None
+            gpus.append((name, capability))
+        return tuple(gpus)
+    finally:
+        pynvml.nvmlShutdown()
+
 def test_gpu_availability():
     """Test GPU availability"""
     print("\n=== Testing GPU Availability ===")
     
     try:
-        import torch
+        gpus = _probe_gpus_nvml()
+        
+        # Importing torch and reading version info does not touch the driver
+        try:
+            import torch
+            print(f"PyTorch version: {torch.__version__}")
+        except ImportError:
+            torch = None
+            print("PyTorch not installed")
         
-        print(f"PyTorch version: {torch.__version__}")
-        print(f"CUDA available: {torch.cuda.is_available()}")
+        if gpus is None:
+            # NVML unavailable: fall back to the CUDA runtime (creates a context)
+            if torch is None:
+                raise RuntimeError("neither NVML nor PyTorch is available")
+            gpus = tuple(
+                (torch.cuda.get_device_name(i), torch.cuda.get_device_capability(i))
+                for i in range(torch.cuda.device_count())
+            ) if torch.cuda.is_available() else ()
         
-        if torch.cuda.is_available():
-            print(f"CUDA version: {torch.version.cuda}")
-            print(f"GPU count: {torch.cuda.device_count()}")
+        print(f"CUDA available: {bool(gpus)}")
+        
+        if gpus:
+            if torch is not None:
+                print(f"CUDA version: {torch.version.cuda}")
+            print(f"GPU count: {len(gpus)}")
             
-            for i in range(torch.cuda.device_count()):
-                gpu_name = torch.cuda.get_device_name(i)
+            for i, (gpu_name, capability) in enumerate(gpus):
                 print(f"  GPU {i}: {gpu_name}")
-                
-                # Get GPU capability
-                capability = torch.cuda.get_device_capability(i)
-                print(f"    Compute capability: {capability[0]}.{capability[1]}")
+                if capability:
+                    print(f"    Compute capability: {capability[0]}.{capability[1]}")
         else:
             print("CUDA not available - will use CPU")
         
@@ -193,27 +263,65 @@ def test_gpu_availability():
     except Exception as e:
         print(f"GPU availability test failed: {e}")
 
+class _ThreadLocalStdout:
+    """stdout proxy that lets a thread collect its own output in a buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self) -> io.StringIO:
+        """Redirect this thread's output into a new buffer"""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text: str) -> int:
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _run_captured(stdout: _ThreadLocalStdout, test_fn) -> str:
+    """Run one test stage on this thread and return its output"""
+    buffer = stdout.capture()
+    test_fn()
+    return buffer.getvalue()
+
+async def run_independent_tests():
+    """Run the independent test stages concurrently, printing their output in order"""
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        outputs = await asyncio.gather(
+            asyncio.to_thread(_run_captured, stdout, test_gpu_availability),
+            # Subtitle manager doesn't require audio
+            asyncio.to_thread(_run_captured, stdout, test_subtitle_manager),
+            # Web interface initialization only
+            asyncio.to_thread(_run_captured, stdout, test_web_interface),
+            asyncio.to_thread(_run_captured, stdout, lambda: asyncio.run(test_tts_integration()))
+        )
+    finally:
+        sys.stdout = stdout._stream
+    
+    # One write for all buffered stage output
+    sys.stdout.write("".join(outputs))
+    sys.stdout.flush()
+
 def main():
     """Run all tests"""
     print("Real-time Whisper Subtitles - Test Script")
     print("=" * 50)
     
-    # Test GPU availability first
-    test_gpu_availability()
-    
-    # Test subtitle manager (doesn't require audio)
-    test_subtitle_manager()
-    
-    # Test web interface initialization
-    test_web_interface()
-    
-    # Test TTS integration
-    asyncio.run(test_tts_integration())
+    # GPU, subtitle manager, web interface and TTS tests share no state
+    asyncio.run(run_independent_tests())
     
     # Test transcriber (requires audio input)
     response = input("\nDo you want to test the real-time transcriber? (requires microphone) [y/N]: ")
     if response.lower() in ['y', 'yes']:
-        test_transcriber()
+        asyncio.run(test_transcriber())
     else:
         print("Skipping transcriber test.")
     
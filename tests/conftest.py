@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+pytest fixtures for Real-time Whisper Subtitles tests
+"""
+
+from pathlib import Path
+
+import pytest
+
+from .test_utils import write_subtitle_fixture
+
+@pytest.fixture
+def subtitle_file(tmp_path):
+    """Factory fixture creating test subtitle files in the per-test tmp_path
+    
+    pytest removes tmp_path itself, so no cleanup is needed:
+    path = subtitle_file("json")
+    """
+    def make(format_type: str = "json") -> Path:
+        path = tmp_path / f"subtitles.{format_type}"
+        with open(path, 'wb') as f:
+            write_subtitle_fixture(f, format_type)
+        return path
+    return make
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for SubtitleManager
+"""
+
+from dataclasses import asdict
+
+import pytest
+
+import src.subtitle_manager as subtitle_manager
+from src.realtime_transcriber import TranscriptionResult
+from src.subtitle_manager import SubtitleManager, SubtitleSegment
+
+from .test_utils import SAMPLE_TRANSCRIPTION_DATA
+
+def _result(text: str, start: float, end: float, language: str = "en") -> TranscriptionResult:
+    return TranscriptionResult(text, start, end, 0.9, language)
+
+def _overlapping(segments, start_time: float, end_time: float):
+    """Reference time-range query: linear scan"""
+    return [s for s in segments if s.start_time <= end_time and s.end_time >= start_time]
+
+@pytest.fixture
+def manager(tmp_path):
+    """SubtitleManager writing into tmp_path (background auto-save effectively off)"""
+    manager = SubtitleManager(output_dir=str(tmp_path), auto_save_interval=3600)
+    yield manager
+    manager.close()
+
+def test_auto_save_retries_after_failed_write(tmp_path):
+    """Segments from a failed auto-save are written by the next one"""
+    manager = SubtitleManager(output_dir=str(tmp_path), auto_save_interval=3600)
+    try:
+        auto_save_file = tmp_path / f"autosave_{manager.session_id}.jsonl"
+        auto_save_file.mkdir()  # opening a directory for append fails
+        
+        manager.add_transcription(_result("first", 0.0, 1.0))
+        manager.add_transcription(_result("second", 1.0, 2.0))
+        manager.auto_save()
+        assert len(manager._unsaved_segments) == 2
+        
+        auto_save_file.rmdir()
+        manager.add_transcription(_result("third", 2.0, 3.0))
+        manager.auto_save()
+        assert manager._unsaved_segments == []
+        
+        restored = SubtitleManager(output_dir=str(tmp_path), auto_save_interval=0)
+        assert restored.load_from_json(str(auto_save_file)) == 3
+        assert [segment.text for segment in restored.segments] == ["first", "second", "third"]
+    finally:
+        manager.close()
+
+def test_segment_asdict_round_trip(tmp_path):
+    """asdict() gives exactly the constructor fields"""
+    manager = SubtitleManager(output_dir=str(tmp_path), auto_save_interval=0)
+    segment = manager.add_transcription(_result("hello", 0.0, 1.0))
+    segment.to_dict()
+    
+    assert SubtitleSegment(**asdict(segment)) == segment
+    assert SubtitleSegment.from_dict(segment.to_dict()).to_dict() == segment.to_dict()
+
+def test_time_range_overlap(manager):
+    """Segments touching or spanning the range are returned, others are not"""
+    for i, (start, end) in enumerate([(0.0, 1.0), (1.0, 2.0), (2.0, 6.0), (3.0, 4.0), (7.0, 8.0)]):
+        manager.add_transcription(_result(f"s{i}", start, end))
+    
+    assert [s.text for s in manager.get_segments_by_time_range(3.5, 3.6)] == ["s2", "s3"]
+    assert [s.text for s in manager.get_segments_by_time_range(1.0, 1.0)] == ["s0", "s1"]
+    assert [s.text for s in manager.get_segments_by_time_range(6.5, 6.9)] == []
+    assert [s.text for s in manager.get_segments_by_time_range(5.0, 100.0)] == ["s2", "s4"]
+
+def test_time_range_out_of_order(manager):
+    """An out-of-order start time falls back to a full scan"""
+    for i, (start, end) in enumerate([(0.0, 1.0), (5.0, 6.0), (2.0, 3.0), (8.0, 9.0)]):
+        manager.add_transcription(_result(f"s{i}", start, end))
+    
+    assert not manager._starts_sorted
+    for start, end in [(2.5, 2.5), (0.0, 10.0), (4.0, 7.0), (3.5, 4.5)]:
+        assert manager.get_segments_by_time_range(start, end) == _overlapping(manager.segments, start, end)
+
+def test_time_range_after_eviction_and_compaction(tmp_path):
+    """Column compaction and eviction keep the columns aligned with segments"""
+    manager = SubtitleManager(output_dir=str(tmp_path), auto_save_interval=3600, max_segments=100)
+    try:
+        # Enough appends to compact the columns several times
+        for i in range(1000):
+            manager.add_transcription(_result(f"s{i}", i * 1.0, i * 1.0 + 2.5))
+        
+        assert len(manager.segments) == 100
+        assert manager.segments[0].text == "s900"
+        for start, end in [(0.0, 899.0), (899.0, 901.0), (950.2, 950.4), (0.0, 2000.0)]:
+            assert manager.get_segments_by_time_range(start, end) == _overlapping(manager.segments, start, end)
+        assert [s.text for s in manager.search_segments("S95")] == [f"s95{i}" for i in range(10)]
+    finally:
+        manager.close()
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_search_many(manager, monkeypatch, use_automaton):
+    """Each segment lists every query it matches, including case variants"""
+    if use_automaton and not subtitle_manager.HAS_AHOCORASICK:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(subtitle_manager, "HAS_AHOCORASICK", use_automaton)
+    
+    for i, text in enumerate(["Hello World", "日本語のテスト", "say hello again", "nothing here"]):
+        manager.add_transcription(_result(text, i, i + 1.0))
+    
+    matches = manager.search_many(["hello", "HELLO", "テスト", "", "missing"])
+    assert [(segment.text, queries) for segment, queries in matches] == [
+        ("Hello World", ["hello", "HELLO"]),
+        ("日本語のテスト", ["テスト"]),
+        ("say hello again", ["hello", "HELLO"]),
+    ]
+    assert manager.search_many(["", "missing"]) == []
+
+def test_statistics_languages_in_first_seen_order(manager):
+    """languages keeps first-appearance order and is safe to modify"""
+    for i, language in enumerate(["ja", "en", "ja", "de"]):
+        manager.add_transcription(_result(f"s{i}", i, i + 1.0, language))
+    
+    stats = manager.get_statistics()
+    assert list(stats['languages']) == ["ja", "en", "de"]
+    assert stats['languages']['ja'] == {'count': 2, 'duration': 2.0}
+    
+    stats['languages']['ja']['count'] = 99
+    stats['languages'].clear()
+    assert manager.get_statistics()['languages']['ja']['count'] == 2
+
+def test_recent_segments_matches_list_slicing(manager):
+    """get_recent_segments(count) returns segments[-count:]"""
+    for i in range(5):
+        manager.add_transcription(_result(f"s{i}", i, i + 1.0))
+    
+    segments = list(manager.segments)
+    for count in [0, 1, 3, 5, 10, -2, -10]:
+        assert manager.get_recent_segments(count) == segments[-count:]
+
+def test_load_from_json_fixture(manager, subtitle_file):
+    """The JSON subtitle fixture loads back as segments"""
+    assert manager.load_from_json(str(subtitle_file("json"))) == len(SAMPLE_TRANSCRIPTION_DATA)
+    
+    assert [segment.text for segment in manager.segments] == [data.text for data in SAMPLE_TRANSCRIPTION_DATA]
+    assert manager.segment_counter == len(SAMPLE_TRANSCRIPTION_DATA)
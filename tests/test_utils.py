@@ -6,54 +6,92 @@ Testing utilities and test data generation
 
 import json
 import tempfile
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Tuple
+
+# Fast JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Typed test records (requirements-dev.txt)
+import msgspec
 
 # Test data for subtitle testing
-SAMPLE_TRANSCRIPTION_DATA = [
-    {
-        "text": "Hello, welcome to the real-time speech recognition system.",
-        "start_time": 0.0,
-        "end_time": 3.5,
-        "confidence": 0.95,
-        "language": "en"
-    },
-    {
-        "text": "This system uses faster-whisper for accurate transcription.",
-        "start_time": 3.5,
-        "end_time": 7.2,
-        "confidence": 0.92,
-        "language": "en"
-    },
-    {
-        "text": "You can export subtitles in multiple formats.",
-        "start_time": 7.2,
-        "end_time": 10.8,
-        "confidence": 0.89,
-        "language": "en"
-    },
-    {
-        "text": "The web interface provides real-time feedback.",
-        "start_time": 10.8,
-        "end_time": 14.5,
-        "confidence": 0.94,
-        "language": "en"
-    }
-]
+class SampleTranscription(NamedTuple):
+    """One sample transcription row (use _asdict() where a dict is needed)"""
+    text: str
+    start_time: float
+    end_time: float
+    confidence: float
+    language: str
+
+SAMPLE_TRANSCRIPTION_DATA: Tuple[SampleTranscription, ...] = (
+    SampleTranscription("Hello, welcome to the real-time speech recognition system.", 0.0, 3.5, 0.95, "en"),
+    SampleTranscription("This system uses faster-whisper for accurate transcription.", 3.5, 7.2, 0.92, "en"),
+    SampleTranscription("You can export subtitles in multiple formats.", 7.2, 10.8, 0.89, "en"),
+    SampleTranscription("The web interface provides real-time feedback.", 10.8, 14.5, 0.94, "en"),
+)
 
-def create_test_audio_data():
-    """Create test audio data for testing purposes"""
+# Subtitle file fixtures, encoded once from the constant sample data
+# (JSON segments carry every field export_json writes, so they load back)
+_JSON_FIXTURE_DATA = {
+    "session_id": "test_20250530_120000",
+    "segments": [
+        {"index": i, **data._asdict(), "created_at": "2025-05-30T12:00:00"}
+        for i, data in enumerate(SAMPLE_TRANSCRIPTION_DATA, start=1)
+    ]
+}
+if HAS_ORJSON:
+    _JSON_FIXTURE = orjson.dumps(_JSON_FIXTURE_DATA, option=orjson.OPT_INDENT_2)
+else:
+    _JSON_FIXTURE = json.dumps(_JSON_FIXTURE_DATA, ensure_ascii=False, indent=2).encode('utf-8')
+
+_TXT_FIXTURE = "".join(
+    f"[{data.start_time:.2f} - {data.end_time:.2f}] {data.text}\n"
+    for data in SAMPLE_TRANSCRIPTION_DATA
+).encode('utf-8')
+
+@functools.lru_cache(maxsize=16)
+def _sine_wave(duration: float, sample_rate: int, frequency: float):
+    """Generate a read-only float32 sine wave (cached, shared between callers)"""
     import numpy as np
     
-    # Generate simple sine wave for testing
-    sample_rate = 16000
-    duration = 2.0  # seconds
-    frequency = 440  # Hz (A note)
+    # Single float32 buffer computed in place (no float64 temporaries)
+    audio_data = np.arange(int(sample_rate * duration), dtype=np.float32)
+    audio_data *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(audio_data, out=audio_data)
+    audio_data *= np.float32(0.5)
     
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    audio_data = np.sin(2 * np.pi * frequency * t) * 0.5
+    # Shared buffer: callers that need to modify it must copy
+    audio_data.setflags(write=False)
+    return audio_data
+
+def create_test_audio_data(duration: float = 2.0, sample_rate: int = 16000, frequency: float = 440):
+    """Create test audio data for testing purposes
     
-    return audio_data.astype(np.float32), sample_rate
+    Simple sine wave (default: 2 seconds of an A note at 16 kHz). The array
+    is cached and read-only; copy it before modifying.
+    """
+    return _sine_wave(duration, sample_rate, frequency), sample_rate
+
+def create_test_audio_batch(frequencies, duration: float = 2.0, sample_rate: int = 16000):
+    """Create a (len(frequencies), samples) float32 batch of test sine waves"""
+    import numpy as np
+    
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    batch = np.empty((len(frequencies), int(sample_rate * duration)), dtype=np.float32)
+    
+    # One broadcast pass over all rows
+    batch[:] = np.arange(batch.shape[1], dtype=np.float32)
+    batch *= (2 * np.pi * frequencies / sample_rate).astype(np.float32)[:, None]
+    np.sin(batch, out=batch)
+    batch *= np.float32(0.5)
+    
+    return batch
 
 def create_test_config():
     """Create test configuration"""
@@ -65,53 +103,41 @@ def create_test_config():
         "compute_type": "int8"
     }
 
+def write_subtitle_fixture(f, format_type: str):
+    """Write test subtitle data to a binary file handle"""
+    if format_type == "json":
+        f.write(_JSON_FIXTURE)
+    elif format_type == "txt":
+        f.write(_TXT_FIXTURE)
+
 def create_test_subtitle_file(format_type: str = "json") -> str:
-    """Create test subtitle file"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{format_type}', delete=False, encoding='utf-8') as f:
-        if format_type == "json":
-            test_data = {
-                "session_id": "test_20250530_120000",
-                "segments": SAMPLE_TRANSCRIPTION_DATA
-            }
-            json.dump(test_data, f, ensure_ascii=False, indent=2)
-        elif format_type == "txt":
-            for i, data in enumerate(SAMPLE_TRANSCRIPTION_DATA):
-                f.write(f"[{data['start_time']:.2f} - {data['end_time']:.2f}] {data['text']}\n")
-        
+    """Create test subtitle file (remove with cleanup_test_files; under
+    pytest prefer the subtitle_file fixture)"""
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=f'.{format_type}', delete=False) as f:
+        write_subtitle_fixture(f, format_type)
         return f.name
 
 def cleanup_test_files(file_paths: List[str]):
     """Clean up test files"""
     for file_path in file_paths:
-        try:
-            Path(file_path).unlink()
-        except FileNotFoundError:
-            pass
+        Path(file_path).unlink(missing_ok=True)
 
-class MockTranscriptionResult:
-    """Mock transcription result for testing"""
-    
-    def __init__(self, text: str, start_time: float, end_time: float, 
-                 confidence: float, language: str):
-        self.text = text
-        self.start_time = start_time
-        self.end_time = end_time
-        self.confidence = confidence
-        self.language = language
-        self.is_final = True
+class MockTranscriptionResult(msgspec.Struct, frozen=True):
+    """Mock transcription result for testing (immutable, so instances can be shared;
+    encodes directly with msgspec.json.encode)"""
+    text: str
+    start_time: float
+    end_time: float
+    confidence: float
+    language: str
+    is_final: bool = True
+
+# Built once at import; the instances are frozen so every caller can share them
+_TEST_RESULTS = tuple(MockTranscriptionResult(*data) for data in SAMPLE_TRANSCRIPTION_DATA)
 
 def get_test_transcription_results():
     """Get list of test transcription results"""
-    results = []
-    for data in SAMPLE_TRANSCRIPTION_DATA:
-        results.append(MockTranscriptionResult(
-            text=data["text"],
-            start_time=data["start_time"],
-            end_time=data["end_time"],
-            confidence=data["confidence"],
-            language=data["language"]
-        ))
-    return results
+    return list(_TEST_RESULTS)
 
 if __name__ == "__main__":
     # Test the utilities